@@ -4,22 +4,24 @@ Job Search Assistant CLI
 Search for remote jobs and identify companies with Taiwan team members
 """
 import asyncio
+import csv
 import os
+import sys
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
 import click
-import pandas as pd
 from dotenv import load_dotenv
 from loguru import logger
 from rich.console import Console
 from rich.table import Table
 
-from src.scrapers import IndeedScraper, get_indeed_scraper, CRAWL4AI_AVAILABLE, KAMELEO_AVAILABLE
-from src.database import JobStorage
-from src.utils import JobDeduplicator
-from src.models import JobBoard
+from src.scrapers import get_indeed_scraper, PagedScraper, CRAWL4AI_AVAILABLE, KAMELEO_AVAILABLE
+from src.database import get_storage
+from src.database.models import JobBoardEnum
+from src.utils import JobDeduplicator, RankingConfig
+from src.models import JobBoard, JobListing
 
 # Load environment variables
 load_dotenv()
@@ -31,6 +33,12 @@ file_handler_id = logger.add(log_file, rotation="1 day", retention="7 days", lev
 
 console = Console()
 
+# Database enum name -> model enum, resolved once instead of per row
+_BOARD_MAP = {board.name: JobBoard[board.name] for board in JobBoardEnum}
+
+# Description length kept in CSV exports
+DESCRIPTION_PREVIEW_CHARS = 200
+
 
 @click.group()
 def cli():
@@ -51,8 +59,9 @@ def cli():
 @click.option('--scraper', default='seleniumbase', type=click.Choice(['seleniumbase', 'playwright', 'crawl4ai', 'kameleo']), help='Scraper implementation (seleniumbase=UC mode, playwright=basic, crawl4ai=LLM, kameleo=best anti-detection)')
 @click.option('--extraction-mode', default='css', type=click.Choice(['css', 'llm', 'hybrid']), help='Crawl4AI extraction mode (llm/hybrid requires API key)')
 @click.option('--llm-model', default=None, help='Specific LLM model (e.g., openrouter/moonshot-ai/kimi-k2-thinking)')
+@click.option('--max-concurrency', default=1, help='Results pages to scrape in parallel (seleniumbase only, 1=serial)')
 @click.option('--verbose', '-v', is_flag=True, help='Enable verbose debug logging')
-def search(query: str, location: str, max_results: int, board: str, remote_only: bool, save: bool, export: Optional[str], browser: str, headless: bool, scraper: str, extraction_mode: str, llm_model: Optional[str], verbose: bool):
+def search(query: str, location: str, max_results: int, board: str, remote_only: bool, save: bool, export: Optional[str], browser: str, headless: bool, scraper: str, extraction_mode: str, llm_model: Optional[str], max_concurrency: int, verbose: bool):
     """
     Search for jobs on job boards
 
@@ -70,6 +79,9 @@ def search(query: str, location: str, max_results: int, board: str, remote_only:
     With SeleniumBase UC mode (default):
       python main.py search "your query" --scraper seleniumbase
 
+    Scrape 3 results pages at a time (challenged pages share one browser):
+      python main.py search "your query" --max-results 50 --max-concurrency 3
+
     With Playwright:
       python main.py search "your query" --scraper playwright
 
@@ -88,7 +100,10 @@ def search(query: str, location: str, max_results: int, board: str, remote_only:
         console_handler_id = logger.add(lambda msg: console.print(msg, end=''), level="DEBUG")
         console.print("[yellow]🐛 Verbose logging enabled[/yellow]")
     else:
-        console_handler_id = logger.add(lambda msg: console.print(msg, end=''), level="INFO")
+        # Plain stderr sink: skips Rich markup parsing for every log line
+        console_handler_id = logger.add(
+            sys.stderr, level="INFO", colorize=False, format="{time:HH:mm:ss} | {message}"
+        )
 
     console.print(f"\n[bold blue]Searching for:[/bold blue] {query}")
     console.print(f"[dim]Location: {location} | Board: {board} | Max results: {max_results}[/dim]")
@@ -140,7 +155,7 @@ def search(query: str, location: str, max_results: int, board: str, remote_only:
                 console.print("[dim]Available providers: OpenRouter (recommended for Kimi K2), OpenAI, Anthropic[/dim]")
 
     # Run async scraping
-    jobs = asyncio.run(_search_jobs(query, location, max_results, board, remote_only, browser, headless, scraper, extraction_mode, llm_model))
+    jobs = asyncio.run(_search_jobs(query, location, max_results, board, remote_only, browser, headless, scraper, extraction_mode, llm_model, max_concurrency))
 
     if not jobs:
         console.print("[yellow]No jobs found.[/yellow]")
@@ -154,7 +169,7 @@ def search(query: str, location: str, max_results: int, board: str, remote_only:
 
     # Save to database
     if save:
-        db = JobStorage(os.getenv('DATABASE_URL', 'sqlite:///jobs.db'))
+        db = get_storage(os.getenv('DATABASE_URL', 'sqlite:///jobs.db'))
         saved = db.save_jobs(unique_jobs)
         console.print(f"[green]Saved {saved} new jobs to database[/green]\n")
 
@@ -178,40 +193,33 @@ def list(limit: int, min_taiwan_team: int, enriched_only: bool, export: Optional
 
     Example: python main.py list --limit 20 --min-taiwan-team 1
     """
-    db = JobStorage(os.getenv('DATABASE_URL', 'sqlite:///jobs.db'))
-    jobs = db.get_jobs(limit=limit, min_taiwan_team=min_taiwan_team, enriched_only=enriched_only)
+    db = get_storage(os.getenv('DATABASE_URL', 'sqlite:///jobs.db'))
+    # Descriptions are only shown in CSV exports, so skip loading them otherwise
+    rows = db.get_jobs_lite(
+        limit=limit,
+        min_taiwan_team=min_taiwan_team,
+        enriched_only=enriched_only,
+        include_description=bool(export)
+    )
 
-    if not jobs:
+    if not rows:
         console.print("[yellow]No jobs found in database.[/yellow]")
         return
 
-    console.print(f"\n[bold blue]Jobs from database:[/bold blue] {len(jobs)} jobs\n")
+    console.print(f"\n[bold blue]Jobs from database:[/bold blue] {len(rows)} jobs\n")
 
-    # Convert to JobListing for display
-    from src.models import JobListing
-    job_listings = []
-    for job in jobs:
-        job_listing = JobListing(
-            id=job.id,
-            title=job.title,
-            company=job.company,
-            location=job.location,
-            description=job.description,
-            url=job.url,
-            posted_date=job.posted_date,
-            board_source=JobBoard[job.board_source.name],
-            scraped_at=job.scraped_at
-        )
-        # Add enrichment info if available
-        if enriched_only or job.taiwan_team_count > 0:
-            console.print(f"  Taiwan team: {job.taiwan_team_count}, Score: {job.ranking_score}")
+    # Rows carry every displayed/exported field, so render them directly
+    # without rebuilding JobListing objects
+    with_team = sum(1 for row in rows if row.taiwan_team_count > 0)
+    show_score = enriched_only or with_team > 0
 
-        job_listings.append(job_listing)
+    _display_jobs_table(rows, show_score=show_score)
 
-    _display_jobs_table(job_listings, show_score=enriched_only)
+    if with_team:
+        console.print(f"[dim]{with_team} of {len(rows)} jobs have Taiwan team members[/dim]")
 
     if export:
-        _export_to_csv(job_listings, export)
+        _export_to_csv(rows, export)
         console.print(f"\n[green]Exported to {export}[/green]")
 
 
@@ -229,36 +237,18 @@ def enrich(service: str, max_jobs: int, min_taiwan_team: int, export: Optional[s
     console.print(f"\n[bold blue]Enriching jobs with {service}[/bold blue]\n")
 
     # Get unenriched jobs from database
-    db = JobStorage(os.getenv('DATABASE_URL', 'sqlite:///jobs.db'))
-    jobs_db = db.get_jobs(limit=max_jobs, enriched_only=False)
+    db = get_storage(os.getenv('DATABASE_URL', 'sqlite:///jobs.db'))
+    rows = db.get_jobs_lite(limit=max_jobs, enriched_only=False)
 
-    if not jobs_db:
+    if not rows:
         console.print("[yellow]No jobs found in database. Run 'search' first.[/yellow]")
         return
 
     # Convert to JobListing
-    from src.models import JobListing
-    jobs = []
-    for job_db in jobs_db:
-        job = JobListing(
-            id=job_db.id,
-            title=job_db.title,
-            company=job_db.company,
-            location=job_db.location,
-            description=job_db.description,
-            url=job_db.url,
-            posted_date=job_db.posted_date,
-            board_source=JobBoard[job_db.board_source.name],
-            scraped_at=job_db.scraped_at
-        )
-        jobs.append(job)
+    jobs = [_row_to_job_listing(row) for row in rows]
 
     console.print(f"Found {len(jobs)} jobs to enrich\n")
 
-    # Run enrichment
-    from src.enrichment import EnrichmentService
-    from src.utils.ranker import RankingConfig
-
     # Load config from env
     target_industries = os.getenv('TARGET_INDUSTRIES', 'Technology,SaaS,Fintech').split(',')
     target_sizes = os.getenv('TARGET_COMPANY_SIZES', '11-50,51-200').split(',')
@@ -291,12 +281,27 @@ def cleanup(days: int):
 
     Example: python main.py cleanup --days 30
     """
-    db = JobStorage(os.getenv('DATABASE_URL', 'sqlite:///jobs.db'))
+    db = get_storage(os.getenv('DATABASE_URL', 'sqlite:///jobs.db'))
     deleted = db.cleanup_old_jobs(days=days)
     console.print(f"[green]Deleted {deleted} jobs older than {days} days[/green]")
 
 
-async def _search_jobs(query: str, location: str, max_results: int, board: str, remote_only: bool, browser: str = 'chromium', headless: bool = True, scraper_type: str = 'seleniumbase', extraction_mode: str = 'css', llm_model: Optional[str] = None):
+def _row_to_job_listing(row) -> JobListing:
+    """Build a JobListing from a JobStorage.get_jobs_lite() row"""
+    return JobListing(
+        id=row.id,
+        title=row.title,
+        company=row.company,
+        location=row.location,
+        description=row.description,
+        url=row.url,
+        posted_date=row.posted_date,
+        board_source=_BOARD_MAP[row.board_source.name],
+        scraped_at=row.scraped_at
+    )
+
+
+async def _search_jobs(query: str, location: str, max_results: int, board: str, remote_only: bool, browser: str = 'chromium', headless: bool = True, scraper_type: str = 'seleniumbase', extraction_mode: str = 'css', llm_model: Optional[str] = None, max_concurrency: int = 1):
     """Async job search"""
     if board == 'indeed':
         config = {
@@ -310,6 +315,14 @@ async def _search_jobs(query: str, location: str, max_results: int, board: str,
         scraper = get_indeed_scraper(scraper_type=scraper_type, config=config)
 
         async with scraper:
+            if max_concurrency > 1 and isinstance(scraper, PagedScraper):
+                pages = range(scraper.max_pages(max_results))
+                jobs = await _search_jobs_parallel(scraper, query, location, pages, remote_only, max_concurrency)
+                return jobs[:max_results]
+
+            if max_concurrency > 1:
+                logger.warning(f"Scraper '{scraper_type}' does not support parallel pages, scraping serially")
+
             jobs = await scraper.search(
                 query=query,
                 location=location,
@@ -322,8 +335,59 @@ async def _search_jobs(query: str, location: str, max_results: int, board: str,
         return []
 
 
+async def _search_jobs_parallel(scraper, query: str, location: str, pages, remote_only: bool, max_concurrency: int = 3):
+    """
+    Scrape results pages concurrently, at most max_concurrency at a time
+
+    The results end at the first empty or short page, so once one comes
+    back every later page is cancelled (or never started).
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def scrape_page(page_num: int):
+        async with semaphore:
+            return await scraper.search_page(query, location, page_num, remote_only)
+
+    page_of = {asyncio.create_task(scrape_page(page_num)): page_num for page_num in pages}
+    pending = set(page_of)
+    results = {}
+    last_page = None
+
+    while pending:
+        done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+
+        for task in done:
+            page_num = page_of[task]
+            # A failed page shouldn't discard the others
+            if task.exception() is not None:
+                error = task.exception()
+                logger.error(f"Failed to scrape page {page_num}: {type(error).__name__}: {error}")
+                continue
+            results[page_num] = task.result()
+            if scraper.is_last_page(results[page_num]) and (last_page is None or page_num < last_page):
+                logger.info(f"Page {page_num} is the last page of results")
+                last_page = page_num
+
+        if last_page is not None:
+            beyond = {task for task in pending if page_of[task] > last_page}
+            for task in beyond:
+                task.cancel()
+            pending -= beyond
+            await asyncio.gather(*beyond, return_exceptions=True)
+
+    # Keep page order, dropping anything past the last page
+    jobs = []
+    for page_num in sorted(results):
+        if last_page is None or page_num <= last_page:
+            jobs.extend(results[page_num])
+
+    logger.info(f"Found {len(jobs)} jobs across {len(results)} pages")
+    return jobs
+
+
 async def _enrich_jobs_async(jobs, service, ranking_config):
     """Async job enrichment"""
+    # Imported lazily: only the enrich command needs the HTTP clients
     from src.enrichment import EnrichmentService
 
     async with EnrichmentService(service=service) as enrichment_service:
@@ -343,26 +407,16 @@ def _display_jobs_table(jobs, show_score=False):
         table.add_column("TW Team", width=8)
 
     for job in jobs:
-        posted = job.posted_date.strftime('%Y-%m-%d') if job.posted_date else 'Unknown'
-
+        cells = [
+            job.title[:40],
+            job.company[:20],
+            job.location[:15],
+            job.posted_date.strftime('%Y-%m-%d') if job.posted_date else 'Unknown'
+        ]
         if show_score:
-            score = getattr(job, 'ranking_score', 0.0)
-            tw_count = getattr(job, 'taiwan_team_count', 0)
-            table.add_row(
-                job.title[:40],
-                job.company[:20],
-                job.location[:15],
-                posted,
-                f"{score:.1f}",
-                str(tw_count)
-            )
-        else:
-            table.add_row(
-                job.title[:40],
-                job.company[:20],
-                job.location[:15],
-                posted
-            )
+            cells.append(f"{job.ranking_score or 0.0:.1f}")
+            cells.append(str(job.taiwan_team_count or 0))
+        table.add_row(*cells)
 
     console.print(table)
 
@@ -390,45 +444,68 @@ def _display_enriched_jobs_table(jobs):
     console.print(table)
 
 
+def _isoformat(value: Optional[datetime]) -> str:
+    """Format a datetime for CSV export ('' if missing)"""
+    return value.isoformat() if value is not None else ''
+
+
+def _description_preview(description: Optional[str]) -> str:
+    """Truncate a description to DESCRIPTION_PREVIEW_CHARS for CSV export"""
+    if not description:
+        return ''
+    if len(description) <= DESCRIPTION_PREVIEW_CHARS:
+        return description
+    return description[:DESCRIPTION_PREVIEW_CHARS] + '...'
+
+
 def _export_to_csv(jobs, filepath: str):
     """Export jobs to CSV"""
-    data = []
-    for job in jobs:
-        data.append({
-            'title': job.title,
-            'company': job.company,
-            'location': job.location,
-            'url': job.url,
-            'posted_date': job.posted_date.isoformat() if job.posted_date else '',
-            'description': job.description[:200] + '...' if len(job.description) > 200 else job.description,
-            'board': job.board_source.value,
-            'scraped_at': job.scraped_at.isoformat() if job.scraped_at else ''
-        })
-
-    df = pd.DataFrame(data)
-    df.to_csv(filepath, index=False)
+    with open(filepath, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow([
+            'title', 'company', 'location', 'url', 'posted_date',
+            'description', 'board', 'scraped_at'
+        ])
+        writer.writerows(
+            (
+                job.title,
+                job.company,
+                job.location,
+                job.url,
+                _isoformat(job.posted_date),
+                _description_preview(job.description),
+                job.board_source.value,
+                _isoformat(job.scraped_at)
+            )
+            for job in jobs
+        )
 
 
 def _export_enriched_to_csv(jobs, filepath: str):
     """Export enriched jobs to CSV"""
-    data = []
-    for job in jobs:
-        data.append({
-            'title': job.title,
-            'company': job.company,
-            'location': job.location,
-            'url': job.url,
-            'taiwan_team_count': job.taiwan_team_count,
-            'ranking_score': job.ranking_score,
-            'industry': job.industry or '',
-            'company_size': job.company_size or '',
-            'posted_date': job.posted_date.isoformat() if job.posted_date else '',
-            'description': job.description[:200] + '...' if len(job.description) > 200 else job.description,
-            'board': job.board_source.value
-        })
-
-    df = pd.DataFrame(data)
-    df.to_csv(filepath, index=False)
+    with open(filepath, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow([
+            'title', 'company', 'location', 'url', 'taiwan_team_count',
+            'ranking_score', 'industry', 'company_size', 'posted_date',
+            'description', 'board'
+        ])
+        writer.writerows(
+            (
+                job.title,
+                job.company,
+                job.location,
+                job.url,
+                job.taiwan_team_count,
+                job.ranking_score,
+                job.industry or '',
+                job.company_size or '',
+                _isoformat(job.posted_date),
+                _description_preview(job.description),
+                job.board_source.value
+            )
+            for job in jobs
+        )
 
 
 if __name__ == '__main__':
@@ -1,5 +1,5 @@
 """Database models and storage"""
-from .models import Job, Company, TeamMember, Base
-from .storage import JobStorage
+from .models import Job, Company, TeamMember, CompanyLookupMiss, Base
+from .storage import JobStorage, get_storage
 
-__all__ = ['Job', 'Company', 'TeamMember', 'Base', 'JobStorage']
+__all__ = ['Job', 'Company', 'TeamMember', 'CompanyLookupMiss', 'Base', 'JobStorage', 'get_storage']
@@ -1,5 +1,5 @@
 """SQLAlchemy database models"""
-from sqlalchemy import Column, String, Integer, Float, DateTime, Text, ForeignKey, Enum as SQLEnum
+from sqlalchemy import Column, String, Integer, Float, DateTime, Text, ForeignKey, Index, text, Enum as SQLEnum
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 from datetime import datetime
@@ -48,6 +48,15 @@ class Job(Base):
     # Relationships
     company_profile = relationship("Company", back_populates="jobs")
 
+    # Indexes for list/enrich filters and cleanup_old_jobs age scans
+    __table_args__ = (
+        Index('ix_jobs_scraped_at', 'scraped_at'),
+        Index('ix_jobs_taiwan_team_count', 'taiwan_team_count'),
+        Index('ix_jobs_enriched_at_partial', 'enriched_at', sqlite_where=text('enriched_at IS NOT NULL')),
+        Index('ix_jobs_board_posted', 'board_source', 'posted_date'),
+        Index('ix_jobs_ranking_posted', 'ranking_score', 'posted_date'),
+    )
+
     def __repr__(self):
         return f"<Job(id={self.id}, title='{self.title}', company='{self.company}')>"
 
@@ -84,7 +93,7 @@ class TeamMember(Base):
     __tablename__ = 'team_members'
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    company_id = Column(String(100), ForeignKey('companies.id'), nullable=False)
+    company_id = Column(String(100), ForeignKey('companies.id'), nullable=False, index=True)
     name = Column(String(200))
     title = Column(String(200))
     location = Column(String(200))
@@ -97,3 +106,14 @@ class TeamMember(Base):
 
     def __repr__(self):
         return f"<TeamMember(name='{self.name}', title='{self.title}', location='{self.location}')>"
+
+
+class CompanyLookupMiss(Base):
+    """Company names the enrichment API could not find (negative cache)"""
+    __tablename__ = 'company_lookup_misses'
+
+    name = Column(String(200), primary_key=True)
+    checked_at = Column(DateTime, nullable=False, default=datetime.now)
+
+    def __repr__(self):
+        return f"<CompanyLookupMiss(name='{self.name}', checked_at={self.checked_at})>"
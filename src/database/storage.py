@@ -1,13 +1,65 @@
 """Database storage and operations"""
-from typing import List, Optional
-from sqlalchemy import create_engine, and_, or_
-from sqlalchemy.orm import sessionmaker, Session, joinedload
+import functools
+from typing import Dict, Iterable, List, Optional, Set
+from sqlalchemy import (
+    create_engine, event, inspect, make_url, and_, or_, bindparam, delete, insert, select, update, Row, Select
+)
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import sessionmaker, Session, joinedload, selectinload
 from datetime import datetime, timedelta
 from loguru import logger
 
-from .models import Base, Job, Company, TeamMember, JobBoardEnum
+from .models import Base, Job, Company, TeamMember, CompanyLookupMiss, JobBoardEnum
 from ..models import JobListing, EnrichedJob, JobBoard, CompanyProfile
 
+# Stay well below SQLite's default bound-parameter limit (999) for IN (...) queries
+SQLITE_MAX_VARIABLES = 900
+
+# JobBoard (dataclass side) -> JobBoardEnum (ORM side), resolved once instead of per row
+_BOARD_MAP = {board.name: JobBoardEnum[board.name] for board in JobBoard}
+
+# Column names update_job_enrichment() accepts as extra fields
+JOB_COLUMNS = frozenset(Job.__table__.columns.keys())
+
+# Dialect-specific INSERT constructs supporting ON CONFLICT DO NOTHING
+ON_CONFLICT_INSERTS = {
+    'sqlite': sqlite_insert,
+    'postgresql': postgresql_insert,
+}
+
+# Connection tuning for SQLite: WAL journaling avoids the double write on commit,
+# synchronous=NORMAL drops most fsyncs (safe under WAL), and a larger page cache
+# plus mmap cut read overhead for list/enrich scans
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",  # 256 MB
+    "PRAGMA cache_size=-65536",  # 64 MB
+    "PRAGMA busy_timeout=5000",
+)
+
+# Pool settings for server databases (PostgreSQL etc.). SQLite file URLs already
+# get a QueuePool from SQLAlchemy and have no server connections to go stale.
+# Sized to cover EnrichmentService's worker threads without queueing.
+SERVER_POOL_OPTIONS = {
+    'pool_size': 10,
+    'max_overflow': 20,
+    'pool_pre_ping': True,
+    'pool_recycle': 3600,
+}
+
+
+def _apply_sqlite_pragmas(dbapi_connection, connection_record):
+    """Apply SQLITE_PRAGMAS to each new DBAPI connection"""
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
+
 
 class JobStorage:
     """Handle job database operations"""
@@ -19,11 +71,34 @@ class JobStorage:
         Args:
             database_url: SQLAlchemy database URL
         """
-        self.engine = create_engine(database_url, echo=False)
+        is_sqlite = make_url(database_url).get_backend_name() == 'sqlite'
+        pool_options = {} if is_sqlite else SERVER_POOL_OPTIONS
+        self.engine = create_engine(database_url, echo=False, **pool_options)
+        if is_sqlite:
+            event.listen(self.engine, 'connect', _apply_sqlite_pragmas)
         Base.metadata.create_all(self.engine)
+        self._create_missing_indexes()
         self.SessionLocal = sessionmaker(bind=self.engine)
         logger.info(f"Database initialized: {database_url}")
 
+    def _create_missing_indexes(self):
+        """Create indexes added to models after their tables already existed"""
+        # create_all() skips existing tables along with their indexes
+        inspector = inspect(self.engine)
+        created = []
+        for table in Base.metadata.sorted_tables:
+            existing = {index['name'] for index in inspector.get_indexes(table.name)}
+            for index in table.indexes:
+                if index.name not in existing:
+                    index.create(self.engine)
+                    created.append(index.name)
+
+        if created:
+            # Refresh planner statistics so populated tables start using the new indexes
+            with self.engine.begin() as conn:
+                conn.exec_driver_sql("ANALYZE")
+            logger.info(f"Created indexes: {', '.join(created)}")
+
     def get_session(self) -> Session:
         """Get a new database session"""
         return self.SessionLocal()
@@ -38,37 +113,45 @@ class JobStorage:
         Returns:
             Number of jobs saved (excluding duplicates)
         """
+        if not jobs:
+            return 0
+
         session = self.get_session()
-        saved_count = 0
 
         try:
+            # Build insert payloads up front, keeping the first occurrence of each ID
+            rows = {}
             for job in jobs:
-                # Check if job already exists
-                existing = session.query(Job).filter_by(id=job.id).first()
-
-                if existing:
-                    logger.debug(f"Job already exists: {job.id}")
+                if job.id in rows:
                     continue
-
-                # Convert JobListing to Job model
-                db_job = Job(
-                    id=job.id,
-                    title=job.title,
-                    company=job.company,
-                    location=job.location,
-                    description=job.description,
-                    url=job.url,
-                    posted_date=job.posted_date,
-                    board_source=JobBoardEnum[job.board_source.name],
-                    salary_min=job.salary_min,
-                    salary_max=job.salary_max,
-                    job_type=job.job_type,
-                    remote_type=job.remote_type,
-                    scraped_at=job.scraped_at
-                )
-
-                session.add(db_job)
-                saved_count += 1
+                rows[job.id] = {
+                    'id': job.id,
+                    'title': job.title,
+                    'company': job.company,
+                    'location': job.location,
+                    'description': job.description,
+                    'url': job.url,
+                    'posted_date': job.posted_date,
+                    'board_source': _BOARD_MAP[job.board_source.name],
+                    'salary_min': job.salary_min,
+                    'salary_max': job.salary_max,
+                    'job_type': job.job_type,
+                    'remote_type': job.remote_type,
+                    'scraped_at': job.scraped_at,
+                }
+
+            on_conflict_insert = ON_CONFLICT_INSERTS.get(self.engine.dialect.name)
+
+            if on_conflict_insert is not None:
+                # Let the database skip existing IDs (INSERT ... ON CONFLICT DO NOTHING)
+                # in one executemany, with no pre-check SELECT
+                stmt = on_conflict_insert(Job).on_conflict_do_nothing(index_elements=['id'])
+                saved_count = session.connection().execute(stmt, list(rows.values())).rowcount
+            else:
+                new_rows = self._exclude_existing_jobs(session, rows)
+                if new_rows:
+                    session.execute(insert(Job), new_rows)
+                saved_count = len(new_rows)
 
             session.commit()
             logger.info(f"Saved {saved_count} new jobs (skipped {len(jobs) - saved_count} duplicates)")
@@ -81,6 +164,20 @@ class JobStorage:
         finally:
             session.close()
 
+    @staticmethod
+    def _exclude_existing_jobs(session: Session, rows: Dict[str, dict]) -> List[dict]:
+        """Drop rows whose ID is already stored (for dialects without ON CONFLICT)"""
+        # One query per chunk of IDs rather than one per job
+        incoming_ids = list(rows)
+        existing_ids = set()
+        for start in range(0, len(incoming_ids), SQLITE_MAX_VARIABLES):
+            chunk = incoming_ids[start:start + SQLITE_MAX_VARIABLES]
+            existing_ids.update(
+                session.scalars(select(Job.id).where(Job.id.in_(chunk)))
+            )
+
+        return [row for job_id, row in rows.items() if job_id not in existing_ids]
+
     def get_jobs(
         self,
         limit: int = 100,
@@ -101,23 +198,74 @@ class JobStorage:
         session = self.get_session()
 
         try:
-            query = session.query(Job)
+            query = self._build_jobs_query(select(Job), limit, min_taiwan_team, enriched_only)
+            return list(session.scalars(query))
 
-            if enriched_only:
-                query = query.filter(Job.enriched_at.isnot(None))
+        finally:
+            session.close()
 
-            if min_taiwan_team > 0:
-                query = query.filter(Job.taiwan_team_count >= min_taiwan_team)
+    def get_jobs_lite(
+        self,
+        limit: int = 100,
+        min_taiwan_team: int = 0,
+        enriched_only: bool = False,
+        include_description: bool = True
+    ) -> List[Row]:
+        """
+        Retrieve job columns needed to rebuild JobListing objects
+
+        Same filtering and ordering as get_jobs(), but selects plain columns
+        instead of ORM entities, skipping identity-map and relationship setup.
+
+        Args:
+            limit: Maximum number of jobs to return
+            min_taiwan_team: Minimum Taiwan team members
+            enriched_only: Only return enriched jobs
+            include_description: Load the description column. Descriptions
+                are the bulk of each row, so skip them when only displaying.
 
-            # Order by ranking score (desc), then posted date (desc)
-            query = query.order_by(Job.ranking_score.desc(), Job.posted_date.desc())
+        Returns:
+            List of Row tuples with JobListing fields plus
+            taiwan_team_count and ranking_score
+        """
+        session = self.get_session()
 
-            jobs = query.limit(limit).all()
-            return jobs
+        try:
+            columns = [
+                Job.id,
+                Job.title,
+                Job.company,
+                Job.location,
+                Job.url,
+                Job.posted_date,
+                Job.board_source,
+                Job.scraped_at,
+                Job.taiwan_team_count,
+                Job.ranking_score,
+            ]
+            if include_description:
+                columns.append(Job.description)
+
+            query = self._build_jobs_query(select(*columns), limit, min_taiwan_team, enriched_only)
+            return session.execute(query).all()
 
         finally:
             session.close()
 
+    @staticmethod
+    def _build_jobs_query(query: Select, limit: int, min_taiwan_team: int, enriched_only: bool) -> Select:
+        """Apply get_jobs filters, ordering and limit to a select statement"""
+        if enriched_only:
+            query = query.where(Job.enriched_at.isnot(None))
+
+        if min_taiwan_team > 0:
+            query = query.where(Job.taiwan_team_count >= min_taiwan_team)
+
+        # Order by ranking score (desc), then posted date (desc)
+        query = query.order_by(Job.ranking_score.desc(), Job.posted_date.desc())
+
+        return query.limit(limit)
+
     def save_company(self, company: CompanyProfile) -> bool:
         """
         Save or update company profile
@@ -169,20 +317,24 @@ class JobStorage:
             # Save Taiwan team members
             if company.taiwan_employees:
                 # Delete existing team members
-                session.query(TeamMember).filter_by(company_id=company.id).delete()
-
-                # Add new team members
-                for member in company.taiwan_employees:
-                    team_member = TeamMember(
-                        company_id=company.id,
-                        name=member.get('name'),
-                        title=member.get('title'),
-                        location=member.get('location'),
-                        city=member.get('city'),
-                        country=member.get('country', 'Taiwan'),
-                        linkedin_url=member.get('linkedin_url')
-                    )
-                    session.add(team_member)
+                session.execute(
+                    delete(TeamMember).where(TeamMember.company_id == company.id),
+                    execution_options={'synchronize_session': False}
+                )
+
+                # Add new team members in a single executemany
+                session.execute(insert(TeamMember), [
+                    {
+                        'company_id': company.id,
+                        'name': member.get('name'),
+                        'title': member.get('title'),
+                        'location': member.get('location'),
+                        'city': member.get('city'),
+                        'country': member.get('country', 'Taiwan'),
+                        'linkedin_url': member.get('linkedin_url'),
+                    }
+                    for member in company.taiwan_employees
+                ])
 
             session.commit()
             return True
@@ -224,6 +376,104 @@ class JobStorage:
         finally:
             session.close()
 
+    def get_companies_by_names(self, names: Iterable[str], max_age_days: int = 30) -> Dict[str, Company]:
+        """
+        Get recently enriched companies for many names at once
+
+        Args:
+            names: Company names
+            max_age_days: Maximum age of enrichment data in days
+
+        Returns:
+            Dict mapping name to Company for each name found with recent data
+        """
+        names = list(dict.fromkeys(names))
+        if not names:
+            return {}
+
+        session = self.get_session()
+
+        try:
+            cutoff_date = datetime.now() - timedelta(days=max_age_days)
+            companies = {}
+
+            # One query per chunk of names rather than one per company
+            for start in range(0, len(names), SQLITE_MAX_VARIABLES):
+                chunk = names[start:start + SQLITE_MAX_VARIABLES]
+                query = select(Company).options(
+                    selectinload(Company.team_members)
+                ).where(
+                    Company.name.in_(chunk),
+                    Company.enriched_at >= cutoff_date
+                )
+
+                for company in session.scalars(query):
+                    companies[company.name] = company
+
+            return companies
+
+        finally:
+            session.close()
+
+    def save_company_miss(self, name: str) -> bool:
+        """
+        Record that the enrichment API could not find a company
+
+        Args:
+            name: Company name as looked up
+
+        Returns:
+            True if saved successfully
+        """
+        session = self.get_session()
+
+        try:
+            session.merge(CompanyLookupMiss(name=name, checked_at=datetime.now()))
+            session.commit()
+            return True
+
+        except Exception as e:
+            session.rollback()
+            logger.error(f"Error saving company miss: {e}")
+            return False
+        finally:
+            session.close()
+
+    def get_company_misses(self, names: Iterable[str], max_age_days: int = 7) -> Set[str]:
+        """
+        Get names among the given ones that recently failed to match a company
+
+        Args:
+            names: Company names
+            max_age_days: How long a miss is remembered, in days
+
+        Returns:
+            Set of names with a recent recorded miss
+        """
+        names = list(dict.fromkeys(names))
+        if not names:
+            return set()
+
+        session = self.get_session()
+
+        try:
+            cutoff_date = datetime.now() - timedelta(days=max_age_days)
+            misses = set()
+
+            for start in range(0, len(names), SQLITE_MAX_VARIABLES):
+                chunk = names[start:start + SQLITE_MAX_VARIABLES]
+                misses.update(session.scalars(
+                    select(CompanyLookupMiss.name).where(
+                        CompanyLookupMiss.name.in_(chunk),
+                        CompanyLookupMiss.checked_at >= cutoff_date
+                    )
+                ))
+
+            return misses
+
+        finally:
+            session.close()
+
     def update_job_enrichment(
         self,
         job_id: str,
@@ -261,7 +511,7 @@ class JobStorage:
 
             # Update additional fields
             for key, value in kwargs.items():
-                if hasattr(job, key):
+                if key in JOB_COLUMNS:
                     setattr(job, key, value)
 
             session.commit()
@@ -275,6 +525,50 @@ class JobStorage:
         finally:
             session.close()
 
+    def update_job_enrichment_many(self, records: List[Dict]) -> int:
+        """
+        Update many jobs with enrichment data in a single executemany UPDATE
+
+        Args:
+            records: Dicts holding the job 'id' plus the Job columns to set
+                (company_id, taiwan_team_count, ranking_score, ...). Every
+                record must have the same keys.
+
+        Returns:
+            Number of jobs updated (unknown job IDs are skipped)
+        """
+        if not records:
+            return 0
+
+        columns = [key for key in records[0] if key != 'id'] + ['enriched_at']
+        jobs_table = Job.__table__
+        # Bind names are prefixed: Core reserves bare column names for SET values
+        stmt = (
+            update(jobs_table)
+            .where(jobs_table.c.id == bindparam('b_id'))
+            .values({column: bindparam(f"b_{column}") for column in columns})
+        )
+        enriched_at = datetime.now()
+        params = [
+            {f"b_{key}": value for key, value in {**record, 'enriched_at': enriched_at}.items()}
+            for record in records
+        ]
+
+        session = self.get_session()
+
+        try:
+            updated = session.connection().execute(stmt, params).rowcount
+            session.commit()
+            logger.debug(f"Updated enrichment for {updated} jobs")
+            return updated
+
+        except Exception as e:
+            session.rollback()
+            logger.error(f"Error updating job enrichment: {e}")
+            return 0
+        finally:
+            session.close()
+
     def cleanup_old_jobs(self, days: int = 30) -> int:
         """
         Delete jobs older than specified days
@@ -289,7 +583,12 @@ class JobStorage:
 
         try:
             cutoff_date = datetime.now() - timedelta(days=days)
-            deleted = session.query(Job).filter(Job.scraped_at < cutoff_date).delete()
+            # Plain bulk DELETE: no need to evaluate matching rows against the session
+            result = session.execute(
+                delete(Job).where(Job.scraped_at < cutoff_date),
+                execution_options={'synchronize_session': False}
+            )
+            deleted = result.rowcount
             session.commit()
             logger.info(f"Deleted {deleted} old jobs")
             return deleted
@@ -300,3 +599,20 @@ class JobStorage:
             return 0
         finally:
             session.close()
+
+
+@functools.lru_cache(maxsize=4)
+def get_storage(database_url: str = "sqlite:///jobs.db") -> JobStorage:
+    """
+    Get a shared JobStorage for a database URL
+
+    Reuses one engine and connection pool per URL for the whole process
+    instead of building a new engine for every caller.
+
+    Args:
+        database_url: SQLAlchemy database URL
+
+    Returns:
+        JobStorage instance for the URL
+    """
+    return JobStorage(database_url)
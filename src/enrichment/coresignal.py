@@ -1,13 +1,40 @@
 """Coresignal API integration"""
-import hashlib
 import re
 from typing import Optional, List, Dict
 from datetime import datetime
 import httpx
+import orjson
 from loguru import logger
 
 from ..models import CompanyProfile
 
+# Legal-entity suffixes dropped when guessing a company's domain
+_COMPANY_SUFFIX_RE = re.compile(r'\s+(inc\.?|llc\.?|ltd\.?|corp\.?|corporation|company|co\.?)$')
+
+# Anything that can't appear in the inferred domain label
+_NON_DOMAIN_CHARS_RE = re.compile(r'\W+')
+
+# Common cities in target countries
+CITIES = {
+    'Taiwan': ['Taipei', 'Hsinchu', 'Taichung', 'Tainan', 'Kaohsiung'],
+    'China': ['Beijing', 'Shanghai', 'Shenzhen', 'Guangzhou', 'Hangzhou', 'Chengdu'],
+    'Singapore': ['Singapore'],
+    'Hong Kong': ['Hong Kong']
+}
+
+# Lowercased city -> canonical name, for mapping regex matches back
+_CITY_NAMES = {city.lower(): city for city_list in CITIES.values() for city in city_list}
+
+
+def _city_pattern(cities: List[str]) -> re.Pattern:
+    """Compile a case-insensitive alternation matching any of the given cities"""
+    return re.compile('|'.join(map(re.escape, cities)), re.IGNORECASE)
+
+
+# One compiled pattern per country, plus one covering every country
+_CITY_RE = {country: _city_pattern(city_list) for country, city_list in CITIES.items()}
+_ANY_CITY_RE = _city_pattern(list(_CITY_NAMES.values()))
+
 
 class CoresignalEnricher:
     """Coresignal API for LinkedIn enrichment"""
@@ -24,8 +51,14 @@ class CoresignalEnricher:
         # Updated to v2 API with multi-source endpoint
         self.base_url = "https://api.coresignal.com/cdapi/v2"
 
-        # Configure httpx client with optional proxy
-        client_kwargs = {"timeout": 30.0}
+        # Configure httpx client with optional proxy. HTTP/2 lets concurrent
+        # lookups share one TLS connection; auth headers are set once here.
+        client_kwargs = {
+            "http2": True,
+            "timeout": httpx.Timeout(30.0, connect=5.0),
+            "limits": httpx.Limits(max_connections=100, max_keepalive_connections=50, keepalive_expiry=60.0),
+            "headers": {'apikey': api_key, 'Content-Type': 'application/json'},
+        }
         if proxy:
             client_kwargs["proxies"] = proxy
             logger.info(f"Coresignal client configured with proxy")
@@ -52,11 +85,10 @@ class CoresignalEnricher:
         name = company_name.lower()
 
         # Remove common suffixes
-        name = re.sub(r'\s+(inc\.?|llc\.?|ltd\.?|corp\.?|corporation|company|co\.?)$', '', name)
+        name = _COMPANY_SUFFIX_RE.sub('', name)
 
-        # Remove special characters and spaces
-        name = re.sub(r'[^\w\s-]', '', name)
-        name = re.sub(r'[-\s]+', '', name)
+        # Remove special characters, hyphens and spaces
+        name = _NON_DOMAIN_CHARS_RE.sub('', name)
 
         # Common patterns
         domain = f"{name}.com"
@@ -73,57 +105,54 @@ class CoresignalEnricher:
             company_website: Company website/domain (if known)
 
         Returns:
-            CompanyProfile if found, None otherwise
+            CompanyProfile if found, None if Coresignal has no match
+
+        Raises:
+            httpx.HTTPError: If the request fails, so errors aren't mistaken for misses
         """
-        try:
-            # Use provided website or infer from company name
-            website = company_website or self._infer_website(company_name)
+        # Use provided website or infer from company name
+        website = company_website or self._infer_website(company_name)
 
-            # Use company_clean enrich endpoint (requires website parameter)
-            url = f"{self.base_url}/company_clean/enrich"
-            params = {'website': website}
+        # Use company_clean enrich endpoint (requires website parameter)
+        url = f"{self.base_url}/company_clean/enrich"
+        params = {'website': website}
 
-            logger.debug(f"Coresignal company enrich - URL: {url}")
-            logger.debug(f"Coresignal company enrich - Params: {params}")
+        logger.debug(f"Coresignal company enrich - URL: {url}")
+        logger.debug(f"Coresignal company enrich - Params: {params}")
 
-            response = await self.client.get(
-                url,
-                headers={
-                    'apikey': self.api_key,
-                    'Content-Type': 'application/json'
-                },
-                params=params
-            )
+        response = await self.client.get(
+            url,
+            params=params
+        )
 
-            if response.status_code == 200:
-                company_data = response.json()
-
-                if company_data:
-                    return CompanyProfile(
-                        id=str(company_data.get('id', '')),
-                        name=company_data.get('name', company_name),
-                        linkedin_url=company_data.get('url'),
-                        website=company_data.get('website') or website,
-                        industry=company_data.get('industry'),
-                        company_size=company_data.get('company_size'),
-                        headquarters_location=company_data.get('location'),
-                        description=company_data.get('description'),
-                        total_employees=company_data.get('employee_count'),
-                        enriched_at=datetime.now(),
-                        source='coresignal'
-                    )
-                else:
-                    logger.warning(f"Company not found: {company_name} (website: {website})")
-                    return None
+        if response.status_code == 404:
+            logger.warning(f"Company not found: {company_name} (website: {website})")
+            return None
 
-            else:
-                logger.error(f"Coresignal API error: {response.status_code} - {response.text}")
-                return None
+        if response.status_code != 200:
+            logger.error(f"Coresignal API error: {response.status_code} - {response.text}")
+            response.raise_for_status()
 
-        except Exception as e:
-            logger.error(f"Error fetching company profile for {company_name}: {e}")
+        company_data = orjson.loads(response.content)
+
+        if not company_data:
+            logger.warning(f"Company not found: {company_name} (website: {website})")
             return None
 
+        return CompanyProfile(
+            id=str(company_data.get('id', '')),
+            name=company_data.get('name', company_name),
+            linkedin_url=company_data.get('url'),
+            website=company_data.get('website') or website,
+            industry=company_data.get('industry'),
+            company_size=company_data.get('company_size'),
+            headquarters_location=company_data.get('location'),
+            description=company_data.get('description'),
+            total_employees=company_data.get('employee_count'),
+            enriched_at=datetime.now(),
+            source='coresignal'
+        )
+
     async def get_employees_in_asia(
         self,
         company_website: str,
@@ -181,16 +210,12 @@ class CoresignalEnricher:
 
             response = await self.client.post(
                 url,
-                headers={
-                    'apikey': self.api_key,
-                    'Content-Type': 'application/json'
-                },
                 params=params,
                 json=payload
             )
 
             if response.status_code == 200:
-                employees_data = response.json()
+                employees_data = orjson.loads(response.content)
 
                 employees = []
                 for emp in employees_data:
@@ -220,24 +245,8 @@ class CoresignalEnricher:
         if not location:
             return None
 
-        # Common cities in target countries
-        cities = {
-            'Taiwan': ['Taipei', 'Hsinchu', 'Taichung', 'Tainan', 'Kaohsiung'],
-            'China': ['Beijing', 'Shanghai', 'Shenzhen', 'Guangzhou', 'Hangzhou', 'Chengdu'],
-            'Singapore': ['Singapore'],
-            'Hong Kong': ['Hong Kong']
-        }
-
         # If country is specified, only check cities in that country
-        if country and country in cities:
-            for city in cities[country]:
-                if city.lower() in location.lower():
-                    return city
-        else:
-            # Check all cities
-            for city_list in cities.values():
-                for city in city_list:
-                    if city.lower() in location.lower():
-                        return city
-
-        return None
+        pattern = _CITY_RE.get(country, _ANY_CITY_RE)
+        match = pattern.search(location)
+
+        return _CITY_NAMES[match.group(0).lower()] if match else None
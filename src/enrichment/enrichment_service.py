@@ -1,13 +1,14 @@
 """Main enrichment service with caching"""
+import asyncio
 import os
-from typing import List, Optional
-from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Union
+from datetime import datetime
 from loguru import logger
 
 from .people_data_labs import PeopleDataLabsEnricher
 from .coresignal import CoresignalEnricher
 from ..models import JobListing, EnrichedJob, CompanyProfile
-from ..database import JobStorage
+from ..database import Company, get_storage
 from ..utils import JobRanker, RankingConfig
 
 
@@ -27,7 +28,9 @@ class EnrichmentService:
         service: str = "peopledatalabs",
         api_key: Optional[str] = None,
         cache_days: int = 30,
-        proxy: Optional[str] = None
+        proxy: Optional[str] = None,
+        max_concurrency: Optional[int] = None,
+        miss_cache_days: int = 7
     ):
         """
         Initialize enrichment service
@@ -37,36 +40,53 @@ class EnrichmentService:
             api_key: API key for the service
             cache_days: Number of days to cache company data
             proxy: Optional HTTP/HTTPS proxy URL
+            max_concurrency: Maximum number of companies looked up at once
+                (default: ENRICHMENT_MAX_CONCURRENCY env var, or 8; must be at least 1)
+            miss_cache_days: Number of days to skip companies the API could not find
         """
         self.service = service
         self.cache_days = cache_days
-        self.storage = JobStorage(os.getenv('DATABASE_URL', 'sqlite:///jobs.db'))
+        self.miss_cache_days = miss_cache_days
+        if max_concurrency is None:
+            max_concurrency = int(os.getenv('ENRICHMENT_MAX_CONCURRENCY', '8'))
+        if max_concurrency < 1:
+            raise ValueError(f"ENRICHMENT_MAX_CONCURRENCY must be at least 1, got {max_concurrency}")
+        self.max_concurrency = max_concurrency
+        self.storage = get_storage(os.getenv('DATABASE_URL', 'sqlite:///jobs.db'))
 
         # Get proxy from parameter or environment variable
-        proxy_url = proxy or os.getenv('HTTPS_PROXY') or os.getenv('HTTP_PROXY')
+        self.proxy_url = proxy or os.getenv('HTTPS_PROXY') or os.getenv('HTTP_PROXY')
 
-        # Initialize API client
+        # Validate API credentials now; the client itself is created on the
+        # first cache miss, so fully cached runs never build one
         if service == "peopledatalabs":
             self.api_key = api_key or os.getenv('PEOPLEDATALABS_API_KEY')
             if not self.api_key:
                 raise ValueError("PEOPLEDATALABS_API_KEY not set")
-            self.enricher = PeopleDataLabsEnricher(self.api_key, proxy=proxy_url)
+            self._enricher_class = PeopleDataLabsEnricher
         elif service == "coresignal":
             self.api_key = api_key or os.getenv('CORESIGNAL_API_KEY')
             if not self.api_key:
                 raise ValueError("CORESIGNAL_API_KEY not set")
-            self.enricher = CoresignalEnricher(self.api_key, proxy=proxy_url)
+            self._enricher_class = CoresignalEnricher
         else:
             raise ValueError(f"Unknown service: {service}")
+        self.enricher = None
 
         logger.info(f"Enrichment service initialized: {service}")
 
     async def __aenter__(self):
-        await self.enricher.__aenter__()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        await self.enricher.__aexit__(exc_type, exc_val, exc_tb)
+        if self.enricher is not None:
+            await self.enricher.__aexit__(exc_type, exc_val, exc_tb)
+
+    async def _ensure_enricher(self):
+        """Create and open the API client if it isn't already"""
+        if self.enricher is None:
+            enricher = self._enricher_class(self.api_key, proxy=self.proxy_url)
+            self.enricher = await enricher.__aenter__()
 
     async def enrich_jobs(
         self,
@@ -83,141 +103,215 @@ class EnrichmentService:
         Returns:
             List of EnrichedJob objects, sorted by ranking score
         """
-        enriched_jobs = []
-        companies_processed = set()
-
         logger.info(f"Enriching {len(jobs)} jobs...")
 
+        # Look up each company once, however many jobs it has, using the
+        # first website any of its jobs supplies
+        company_websites = {}
         for job in jobs:
-            # Skip if company already processed (batch optimization)
-            if job.company in companies_processed:
-                logger.debug(f"Skipping duplicate company: {job.company}")
-                # Try to get company from cache
-                cached_company = self.storage.get_company_by_name(
-                    job.company,
-                    max_age_days=self.cache_days
-                )
-                if cached_company:
-                    enriched_job = self._create_enriched_job(job, cached_company)
-                    enriched_jobs.append(enriched_job)
-                else:
-                    # Add job without enrichment
-                    enriched_jobs.append(EnrichedJob.from_job_listing(job))
-                continue
+            if not company_websites.get(job.company):
+                company_websites[job.company] = job.company_website
+
+        # Check cache first, for every company in one query (SQLite I/O runs
+        # in a worker thread to keep the event loop free)
+        companies = await asyncio.to_thread(
+            self.storage.get_companies_by_names,
+            company_websites,
+            max_age_days=self.cache_days
+        )
+        for company_name in companies:
+            logger.info(f"Using cached data for: {company_name}")
 
-            companies_processed.add(job.company)
+        uncached = [name for name in company_websites if name not in companies]
 
-            # Check cache first
-            cached_company = self.storage.get_company_by_name(
-                job.company,
-                max_age_days=self.cache_days
-            )
+        # Don't pay again for companies the API recently failed to match
+        misses = await asyncio.to_thread(
+            self.storage.get_company_misses,
+            uncached,
+            max_age_days=self.miss_cache_days
+        )
+        for company_name in misses:
+            logger.info(f"Skipping recently unmatched company: {company_name}")
+            companies[company_name] = None
+        uncached = [name for name in uncached if name not in misses]
 
-            if cached_company:
-                logger.info(f"Using cached data for: {job.company}")
-                enriched_job = self._create_enriched_job(job, cached_company)
-                enriched_jobs.append(enriched_job)
-                continue
+        if uncached:
+            await self._ensure_enricher()
 
-            # Fetch from API
-            try:
-                company_profile = await self._get_company_with_taiwan_team(
-                    job.company,
-                    job.company_website
-                )
+            # Overlap API round-trips, bounded to respect provider rate limits
+            semaphore = asyncio.Semaphore(self.max_concurrency)
+
+            async def lookup(company_name: str):
+                async with semaphore:
+                    return await self._lookup_company(company_name, company_websites[company_name])
+
+            results = await asyncio.gather(
+                *(lookup(name) for name in uncached),
+                return_exceptions=True
+            )
 
-                if company_profile:
-                    # Save to cache
-                    self.storage.save_company(company_profile)
+            # A failed lookup only costs that company its enrichment
+            found = {}
+            for company_name, result in zip(uncached, results):
+                if isinstance(result, Exception):
+                    logger.error(f"Error enriching {company_name}: {result}")
+                    result = None
+                companies[company_name] = result
+                if result is not None:
+                    found[company_name] = result
 
-                    # Create enriched job
-                    enriched_job = self._create_enriched_job_from_profile(job, company_profile)
-                    enriched_jobs.append(enriched_job)
+            if found:
+                await self._add_asia_teams(found, semaphore)
 
+                # Save to cache
+                await asyncio.to_thread(self._save_companies, found.values())
+
+                for company_name, company_profile in found.items():
                     logger.info(
-                        f"Enriched: {job.company} - "
+                        f"Enriched: {company_name} - "
                         f"{company_profile.taiwan_employee_count} Asia team members"
                     )
-                else:
-                    # Company not found, add without enrichment
-                    logger.warning(f"Company not found: {job.company}")
-                    enriched_jobs.append(EnrichedJob.from_job_listing(job))
-
-            except Exception as e:
-                logger.error(f"Error enriching {job.company}: {e}")
-                enriched_jobs.append(EnrichedJob.from_job_listing(job))
-
-        # Rank jobs
-        if ranking_config:
-            ranker = JobRanker(ranking_config)
-            ranked_jobs = ranker.rank_jobs(enriched_jobs)
-        else:
-            # Use default ranking
-            ranker = JobRanker()
-            ranked_jobs = ranker.rank_jobs(enriched_jobs)
+
+        # Enrich and score in a single pass (default ranking if no config).
+        # Jobs below the Asia team threshold are dropped before an EnrichedJob
+        # is built for them, leaving only the final sort.
+        ranker = JobRanker(ranking_config)
+        ranked_jobs = []
+        for job in jobs:
+            company = companies[job.company]
+            if not ranker.meets_threshold(company.taiwan_employee_count if company else 0):
+                continue
+            enriched_job = self._enrich_job(job, company)
+            enriched_job.ranking_score = ranker.calculate_score(enriched_job)
+            ranked_jobs.append(enriched_job)
+        ranker.sort_jobs(ranked_jobs)
+
+        logger.info(f"Ranked {len(ranked_jobs)} jobs (filtered {len(jobs) - len(ranked_jobs)} below threshold)")
 
         # Save enrichment data to database
-        for enriched_job in ranked_jobs:
-            if enriched_job.company_id:
-                self.storage.update_job_enrichment(
-                    job_id=enriched_job.id,
-                    company_id=enriched_job.company_id,
-                    taiwan_team_count=enriched_job.taiwan_team_count,
-                    ranking_score=enriched_job.ranking_score,
-                    company_size=enriched_job.company_size,
-                    industry=enriched_job.industry,
-                    headquarters_location=enriched_job.headquarters_location
-                )
+        await asyncio.to_thread(self._save_enrichment, ranked_jobs)
 
         logger.info(f"Enrichment complete: {len(ranked_jobs)} jobs ranked")
         return ranked_jobs
 
-    async def _get_company_with_taiwan_team(
+    def _save_enrichment(self, ranked_jobs: List[EnrichedJob]):
+        """Persist enrichment results (blocking, run off the event loop)"""
+        self.storage.update_job_enrichment_many([
+            {
+                'id': enriched_job.id,
+                'company_id': enriched_job.company_id,
+                'taiwan_team_count': enriched_job.taiwan_team_count,
+                'ranking_score': enriched_job.ranking_score,
+                'company_size': enriched_job.company_size,
+                'industry': enriched_job.industry,
+                'headquarters_location': enriched_job.headquarters_location,
+            }
+            for enriched_job in ranked_jobs
+            if enriched_job.company_id
+        ])
+
+    def _save_companies(self, company_profiles: Iterable[CompanyProfile]):
+        """Cache freshly fetched companies (blocking, run off the event loop)"""
+        for company_profile in company_profiles:
+            self.storage.save_company(company_profile)
+
+    async def _lookup_company(
         self,
         company_name: str,
         company_website: Optional[str] = None
     ) -> Optional[CompanyProfile]:
         """
-        Get company profile with Asia team members (Taiwan, China, Singapore, Hong Kong)
+        Fetch a company profile from the enrichment API
+
+        Asia team members are added afterwards by _add_asia_teams(), so that
+        employee searches can be batched across companies.
 
         Args:
             company_name: Company name
             company_website: Company website/domain (optional)
 
         Returns:
-            CompanyProfile with Asia employee data
+            Freshly fetched CompanyProfile, or None if not found or the lookup failed
         """
-        # Get company profile
-        if self.service == "coresignal":
-            # Coresignal requires website parameter
-            company_profile = await self.enricher.get_company_profile(
-                company_name,
-                company_website
-            )
-        else:
-            # PeopleDataLabs uses company name
-            company_profile = await self.enricher.get_company_profile(company_name)
+        try:
+            if self.service == "coresignal":
+                # Coresignal requires website parameter
+                company_profile = await self.enricher.get_company_profile(
+                    company_name,
+                    company_website
+                )
+            else:
+                # PeopleDataLabs uses company name
+                company_profile = await self.enricher.get_company_profile(company_name)
+        except Exception as e:
+            logger.error(f"Error enriching {company_name}: {e}")
+            return None
 
         if not company_profile:
+            logger.warning(f"Company not found: {company_name}")
+            # Only definite misses are remembered; errors are retried next run.
+            # Misses are keyed by name, so a Coresignal miss on a website
+            # inferred from the name isn't kept: a later job may carry the
+            # real website.
+            if self.service != "coresignal" or company_website:
+                await asyncio.to_thread(self.storage.save_company_miss, company_name)
             return None
 
-        # Get Asia employees (Taiwan, China, Singapore, Hong Kong)
-        if self.service == "peopledatalabs":
-            asia_employees = await self.enricher.search_employees_in_asia(company_name)
-        elif self.service == "coresignal":
-            # Coresignal employee search requires company website
-            asia_employees = await self.enricher.get_employees_in_asia(
-                company_profile.website
-            )
-        else:
-            asia_employees = []
+        return company_profile
+
+    def _enrich_job(
+        self,
+        job: JobListing,
+        company: Optional[Union[Company, CompanyProfile]]
+    ) -> EnrichedJob:
+        """Create EnrichedJob from a _lookup_company() result"""
+        if company is None:
+            # Company not found, add without enrichment
+            return EnrichedJob.from_job_listing(job)
+        if isinstance(company, CompanyProfile):
+            return self._create_enriched_job_from_profile(job, company)
+        return self._create_enriched_job(job, company)
+
+    async def _add_asia_teams(
+        self,
+        company_profiles: Dict[str, CompanyProfile],
+        semaphore: asyncio.Semaphore
+    ):
+        """
+        Add Asia team members (Taiwan, China, Singapore, Hong Kong) to company profiles
 
-        # Update company profile with Asia data
-        company_profile.taiwan_employee_count = len(asia_employees)  # Field name kept for compatibility
-        company_profile.taiwan_employees = asia_employees  # Field name kept for compatibility
-        company_profile.enriched_at = datetime.now()
+        People Data Labs searches many companies per request; Coresignal
+        searches each company by website, bounded by the semaphore.
 
-        return company_profile
+        Args:
+            company_profiles: Dictionary of looked-up company name to CompanyProfile
+            semaphore: Limits concurrent per-company searches
+        """
+        if self.service == "peopledatalabs":
+            teams = await self.enricher.search_employees_in_asia_batch(list(company_profiles))
+        else:
+            async def search(company_profile: CompanyProfile):
+                async with semaphore:
+                    # Coresignal employee search requires company website
+                    return await self.enricher.get_employees_in_asia(company_profile.website)
+
+            results = await asyncio.gather(
+                *(search(profile) for profile in company_profiles.values()),
+                return_exceptions=True
+            )
+            teams = {}
+            for company_name, result in zip(company_profiles, results):
+                if isinstance(result, Exception):
+                    logger.error(f"Error searching employees for {company_name}: {result}")
+                    result = []
+                teams[company_name] = result
+
+        # Update company profiles with Asia data
+        for company_name, company_profile in company_profiles.items():
+            asia_employees = teams.get(company_name, [])
+            company_profile.taiwan_employee_count = len(asia_employees)  # Field name kept for compatibility
+            company_profile.taiwan_employees = asia_employees  # Field name kept for compatibility
+            company_profile.enriched_at = datetime.now()
 
     def _create_enriched_job(self, job: JobListing, cached_company) -> EnrichedJob:
         """Create EnrichedJob from cached company data"""
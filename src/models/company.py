@@ -4,7 +4,7 @@ from datetime import datetime
 from typing import Optional, List
 
 
-@dataclass
+@dataclass(slots=True)
 class CompanyProfile:
     """Company information from LinkedIn APIs"""
     id: str
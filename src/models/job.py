@@ -14,7 +14,7 @@ class JobBoard(Enum):
     WEWORKREMOTELY = "weworkremotely"
 
 
-@dataclass
+@dataclass(slots=True)
 class JobListing:
     """Standardized job listing structure across all boards"""
     title: str
@@ -44,7 +44,7 @@ class JobListing:
         return hashlib.md5(key.encode()).hexdigest()[:16]
 
 
-@dataclass
+@dataclass(slots=True)
 class EnrichedJob:
     """Job listing with LinkedIn enrichment data"""
     # Copy all fields from JobListing
@@ -75,8 +75,16 @@ class EnrichedJob:
     ranking_score: float = 0.0
 
     @classmethod
-    def from_job_listing(cls, job: JobListing, **enrichment_data):
-        """Create EnrichedJob from JobListing"""
+    def from_job_listing(cls, job: JobListing, include_raw_html: bool = False, **enrichment_data):
+        """
+        Create EnrichedJob from JobListing
+
+        Args:
+            job: Source job listing
+            include_raw_html: Copy the listing's raw HTML (dropped by default, as
+                it can be hundreds of KB per job and nothing downstream reads it)
+            **enrichment_data: Enrichment fields to set on the copy
+        """
         return cls(
             id=job.id,
             title=job.title,
@@ -92,6 +100,6 @@ class EnrichedJob:
             job_type=job.job_type,
             remote_type=job.remote_type,
             scraped_at=job.scraped_at,
-            raw_html=job.raw_html,
+            raw_html=job.raw_html if include_raw_html else None,
             **enrichment_data
         )
@@ -1,33 +1,57 @@
 """Job board scrapers"""
-from .base import BaseScraper
+from importlib import import_module
+from importlib.util import find_spec
+
+from .base import BaseScraper, PagedScraper
 from .indeed import IndeedScraper  # SeleniumBase UC mode (default)
 
+
+def _module_available(name: str) -> bool:
+    """Check whether a module can be imported, without importing it"""
+    try:
+        return find_spec(name) is not None
+    except ModuleNotFoundError:
+        return False
+
+
+# Optional scrapers are only imported when first used, so CLI commands that
+# never scrape (list, enrich, cleanup) don't pay for playwright/crawl4ai imports
+
 # Playwright-based scraper (optional, requires playwright package)
-try:
-    from .indeed_playwright import IndeedPlaywrightScraper
-    PLAYWRIGHT_AVAILABLE = True
-except ImportError:
-    IndeedPlaywrightScraper = None
-    PLAYWRIGHT_AVAILABLE = False
+PLAYWRIGHT_AVAILABLE = _module_available('playwright')
 
 # Crawl4AI-based scraper (optional, requires crawl4ai package)
-try:
-    from .indeed_crawl4ai import IndeedCrawl4AIScraper
-    CRAWL4AI_AVAILABLE = True
-except ImportError:
-    IndeedCrawl4AIScraper = None
-    CRAWL4AI_AVAILABLE = False
-
-# Kameleo-based scraper (optional, requires kameleo package)
-try:
-    from .indeed_kameleo import IndeedKameleoScraper
-    KAMELEO_AVAILABLE = True
-except ImportError:
-    IndeedKameleoScraper = None
-    KAMELEO_AVAILABLE = False
+CRAWL4AI_AVAILABLE = _module_available('crawl4ai')
+
+# Kameleo-based scraper (optional, requires kameleo and playwright packages)
+KAMELEO_AVAILABLE = PLAYWRIGHT_AVAILABLE and _module_available('kameleo.local_api_client')
+
+# Lazily-loaded scraper class -> (submodule, availability flag)
+_OPTIONAL_SCRAPERS = {
+    'IndeedPlaywrightScraper': ('.indeed_playwright', PLAYWRIGHT_AVAILABLE),
+    'IndeedCrawl4AIScraper': ('.indeed_crawl4ai', CRAWL4AI_AVAILABLE),
+    'IndeedKameleoScraper': ('.indeed_kameleo', KAMELEO_AVAILABLE),
+}
+
+
+def _load_scraper(name: str):
+    """Import an optional scraper class (None if its dependencies are missing)"""
+    module_name, available = _OPTIONAL_SCRAPERS[name]
+    scraper_class = getattr(import_module(module_name, __name__), name) if available else None
+    globals()[name] = scraper_class
+    return scraper_class
+
+
+def __getattr__(name: str):
+    """Resolve optional scraper classes on first attribute access"""
+    if name in _OPTIONAL_SCRAPERS:
+        return _load_scraper(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     'BaseScraper',
+    'PagedScraper',
     'IndeedScraper',
     'IndeedPlaywrightScraper',
     'IndeedCrawl4AIScraper',
@@ -64,21 +88,21 @@ def get_indeed_scraper(scraper_type: str = 'seleniumbase', config: dict = None):
                 "Kameleo scraper requested but kameleo.local-api-client is not installed. "
                 "Install with: pip install kameleo.local-api-client && playwright install chromium"
             )
-        return IndeedKameleoScraper(config)
+        return _load_scraper('IndeedKameleoScraper')(config)
     elif scraper_type == 'crawl4ai':
         if not CRAWL4AI_AVAILABLE:
             raise ImportError(
                 "Crawl4AI scraper requested but crawl4ai is not installed. "
                 "Install with: pip install crawl4ai"
             )
-        return IndeedCrawl4AIScraper(config)
+        return _load_scraper('IndeedCrawl4AIScraper')(config)
     elif scraper_type == 'playwright':
         if not PLAYWRIGHT_AVAILABLE:
             raise ImportError(
                 "Playwright scraper requested but playwright is not installed. "
                 "Install with: pip install playwright && playwright install"
             )
-        return IndeedPlaywrightScraper(config)
+        return _load_scraper('IndeedPlaywrightScraper')(config)
     elif scraper_type == 'seleniumbase':
         return IndeedScraper(config)
     else:
@@ -1,13 +1,24 @@
 """Base scraper abstraction"""
 from abc import ABC, abstractmethod
+from datetime import datetime, timedelta
 from typing import List, Optional
 import asyncio
 import random
+import re
 from loguru import logger
 from fake_useragent import UserAgent
 
 from ..models import JobListing, JobBoard
 
+# Relative posted dates ("3 days ago", "30+ days ago") and their units
+RELATIVE_DATE_RE = re.compile(r'(\d+)\+?\s*(hour|day|week|month)')
+RELATIVE_DATE_UNITS = {
+    'hour': timedelta(hours=1),
+    'day': timedelta(days=1),
+    'week': timedelta(weeks=1),
+    'month': timedelta(days=30),
+}
+
 
 class BaseScraper(ABC):
     """Base scraper with common functionality"""
@@ -45,3 +56,49 @@ class BaseScraper(ABC):
         """Add random delay to mimic human behavior"""
         delay = random.uniform(min_seconds, max_seconds)
         await asyncio.sleep(delay)
+
+    def _parse_posted_date(self, date_text: Optional[str], now: Optional[datetime] = None) -> datetime:
+        """
+        Parse Indeed's relative date format (e.g., '2 days ago')
+
+        Args:
+            date_text: Relative date text
+            now: Reference time (defaults to the current time; pass one per
+                page so every job on it shares a single clock read)
+        """
+        now = now or datetime.now()
+
+        # One scan finds both the number and its unit; "Just posted",
+        # "Today" and empty text have neither and mean the reference time
+        match = RELATIVE_DATE_RE.search(date_text.lower()) if date_text else None
+        if not match:
+            return now
+
+        return now - int(match.group(1)) * RELATIVE_DATE_UNITS[match.group(2)]
+
+
+class PagedScraper(ABC):
+    """Mixin for scrapers whose results pages can be scraped independently (enables parallel page scraping)"""
+
+    # Full results page size; a shorter page is the last one
+    jobs_per_page: int
+
+    @abstractmethod
+    async def search_page(
+        self,
+        query: str,
+        location: str,
+        page_num: int,
+        remote_only: bool = False
+    ) -> List[JobListing]:
+        """Scrape a single results page - must be implemented by subclass"""
+        pass
+
+    @abstractmethod
+    def max_pages(self, max_results: int) -> int:
+        """Number of results pages needed to collect max_results jobs - must be implemented"""
+        pass
+
+    def is_last_page(self, page_jobs: List[JobListing]) -> bool:
+        """Whether a results page came back short of a full page"""
+        return len(page_jobs) < self.jobs_per_page
@@ -1,31 +1,214 @@
 """Indeed job board scraper using SeleniumBase UC mode for anti-detection"""
+import asyncio
 import json
 import os
 import random
 import re
+import threading
 import time
-from datetime import datetime, timedelta
-from typing import List, Optional, Dict, Any
-from urllib.parse import urlencode, quote_plus
+from types import MappingProxyType
+from datetime import datetime
+from typing import List, Optional, Dict, Any, Tuple
+from urllib.parse import urlencode, quote_plus, urlparse
+import httpx
+import orjson
 from loguru import logger
-from bs4 import BeautifulSoup
 
-from .base import BaseScraper
+from .base import BaseScraper, PagedScraper
 from ..models import JobListing, JobBoard
 
-# Pattern to extract mosaic data (embedded JSON with job listings)
-MOSAIC_PATTERN = r'window\.mosaic\.providerData\["mosaic-provider-jobcards"\]\s*=\s*({.*?});'
-
-
-class IndeedScraper(BaseScraper):
+# Assignment of the mosaic data (embedded JSON with job listings); the
+# object itself is decoded in place rather than matched by a regex
+MOSAIC_PREFIX = 'window.mosaic.providerData["mosaic-provider-jobcards"]'
+MOSAIC_ASSIGN_RE = re.compile(r'\s*=\s*')
+_JSON_DECODER = json.JSONDecoder()
+
+# Returns only the text of the <script> holding the mosaic data, so the
+# rendered page (often 1-2MB) need not be marshalled through chromedriver
+MOSAIC_SCRIPT_JS = """
+    for (const script of document.querySelectorAll('script')) {
+        if (script.textContent.indexOf('mosaic-provider-jobcards') >= 0) {
+            return script.textContent;
+        }
+    }
+    return null;
+"""
+
+# Later results pages are fetched over plain HTTP with the browser's
+# Cloudflare cookies; these headers match what Chrome sends for a page load
+HTTP_PAGE_HEADERS = {
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.9',
+}
+HTTP_PAGE_TIMEOUT = 30.0
+
+# Default page request pacing (config 'rps' / 'burst'): at most one results
+# page per 10s, never two back to back. This is a ceiling shared by concurrent
+# page workers; serial searches still wait 15-30s between pages
+DEFAULT_PAGE_RPS = 0.1
+DEFAULT_PAGE_BURST = 1
+
+# Extra random wait added to each rate-limited wait, as a fraction of 1/rps,
+# so paced pages don't start on a fixed interval
+PAGE_WAIT_JITTER = 0.5
+
+# Lowercase page text that marks a CAPTCHA / verification interstitial
+CAPTCHA_MARKERS = ('verify you', 'captcha')
+
+# Shared read-only default for missing nested mosaic objects
+EMPTY_DICT = MappingProxyType({})
+
+# Job card containers (DOM fallback)
+JOB_CARD_SELECTOR = 'div.job_seen_beacon'
+
+# Stealth Chrome arguments, joined once; the per-browser --window-size is
+# appended by IndeedScraper._get_stealth_chrome_args
+STEALTH_CHROME_ARGS = ','.join([
+    # Disable automation flags
+    '--disable-blink-features=AutomationControlled',
+
+    # Disable various Chrome features that can reveal automation
+    '--disable-dev-shm-usage',
+    '--disable-gpu',
+    '--disable-features=IsolateOrigins,site-per-process',
+    '--disable-web-security',
+
+    # Reduce bot detection surface
+    '--no-first-run',
+    '--no-service-autorun',
+    '--password-store=basic',
+    '--system-developer-mode',
+
+    # Performance optimizations
+    '--disable-background-timer-throttling',
+    '--disable-backgrounding-occluded-windows',
+    '--disable-renderer-backgrounding',
+
+    # Disable notifications and infobars
+    '--disable-infobars',
+    '--disable-notifications',
+    '--disable-popup-blocking',
+
+    # Additional stealth options
+    '--disable-browser-side-navigation',
+    '--disable-component-extensions-with-background-pages',
+    '--disable-default-apps',
+    '--disable-extensions',
+    '--disable-hang-monitor',
+    '--disable-prompt-on-repost',
+    '--disable-sync',
+    '--enable-features=NetworkService,NetworkServiceInProcess',
+    '--force-color-profile=srgb',
+    '--hide-scrollbars',
+    '--metrics-recording-only',
+    '--mute-audio',
+    '--no-default-browser-check',
+    '--no-sandbox',
+])
+
+# Viewports picked at random per browser to avoid fingerprinting
+VIEWPORTS = (
+    (1920, 1080), (1366, 768), (1440, 900), (1536, 864),
+    (1600, 900), (1280, 720), (2560, 1440),
+)
+
+# Bot-detection overrides, sent in one execute_script call since every call
+# is a separate chromedriver round trip
+STEALTH_BUNDLE_JS = """
+    Object.defineProperty(navigator, 'webdriver', {
+        get: () => undefined
+    });
+
+    window.navigator.chrome = {
+        runtime: {},
+    };
+
+    const originalQuery = window.navigator.permissions.query;
+    window.navigator.permissions.query = (parameters) => (
+        parameters.name === 'notifications' ?
+            Promise.resolve({ state: Notification.permission }) :
+            originalQuery(parameters)
+    );
+
+    Object.defineProperty(navigator, 'plugins', {
+        get: () => [1, 2, 3, 4, 5],
+    });
+
+    Object.defineProperty(navigator, 'languages', {
+        get: () => ['en-US', 'en'],
+    });
+"""
+
+# Replays [delay_ms, kind, x, y] steps (scrolls and mouse moves) in the page,
+# so a whole browsing pattern costs a single driver round trip
+HUMAN_BEHAVIOR_JS = """
+    for (const [at, kind, x, y] of arguments[0]) {
+        setTimeout(() => {
+            if (kind === 'scroll') {
+                window.scrollTo({top: x, behavior: 'smooth'});
+            } else {
+                document.dispatchEvent(new MouseEvent('mousemove', {
+                    'view': window,
+                    'bubbles': true,
+                    'cancelable': true,
+                    'clientX': x,
+                    'clientY': y
+                }));
+            }
+        }, at);
+    }
+"""
+
+
+def _decode_mosaic(html: str, start: int) -> Tuple[Any, int]:
+    """
+    Decode the mosaic object starting at html[start]
+
+    The object normally fills the rest of its <script> tag, which orjson
+    parses fastest; if other statements follow it, the stdlib decoder
+    finds where the object ends instead.
+
+    Returns:
+        Tuple of (decoded object, end offset in html)
+    """
+    end = html.find('</script>', start)
+    if end == -1:
+        end = len(html)
+    candidate = html[start:end].rstrip().rstrip(';')
+    try:
+        return orjson.loads(candidate), start + len(candidate)
+    except orjson.JSONDecodeError:
+        return _JSON_DECODER.raw_decode(html, start)
+
+
+class IndeedScraper(BaseScraper, PagedScraper):
     """Indeed scraper using SeleniumBase UC mode for Cloudflare bypass"""
 
+    jobs_per_page = 10  # Indeed shows ~10 jobs per page
+    max_pages_per_search = 10
+
     def __init__(self, config: dict = None):
         super().__init__(JobBoard.INDEED, config)
         self.base_url = "https://www.indeed.com"
         self.sb = None
+        self._sb_context = None
+        self._sb_kwargs = None
         self.request_count = 0
         self.max_requests_per_session = 3  # Rotate browser after this many requests
+        # Serializes use of the shared browser across page worker threads
+        self._session_lock = threading.Lock()
+        # HTTP client shared by search_page() calls, opened on first use
+        self._page_client = None
+        self._proxy_url = self.config.get('proxy') or os.getenv('HTTPS_PROXY') or os.getenv('HTTP_PROXY')
+        self._proxy_arg = self._parse_proxy_arg()
+
+        # Page request pacing shared by concurrent page workers: a token bucket
+        # holding up to `burst` tokens, refilled at `rps` tokens per second
+        self._page_rps = self.config.get('rps', DEFAULT_PAGE_RPS)
+        self._page_burst = self.config.get('burst', DEFAULT_PAGE_BURST)
+        self._page_tokens = float(self._page_burst)
+        self._page_tokens_at = time.monotonic()
+        self._rate_lock = asyncio.Lock()
 
     async def __aenter__(self):
         """Async context manager entry"""
@@ -33,69 +216,41 @@ class IndeedScraper(BaseScraper):
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit"""
+        if self._page_client is not None:
+            await self._page_client.aclose()
+            self._page_client = None
         self._close_browser()
 
     def _get_random_user_agent(self) -> str:
-        """Get a random user agent string"""
+        """Get a random Chrome user agent string (UC mode drives Chrome)"""
         try:
-            from fake_useragent import UserAgent
-            ua = UserAgent()
-            return ua.chrome
+            return self.user_agent.chrome
         except Exception:
             return "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
 
+    def _parse_proxy_arg(self) -> Optional[str]:
+        """Parse the configured proxy URL into SeleniumBase's proxy format"""
+        if not self._proxy_url:
+            return None
+
+        try:
+            parsed = urlparse(self._proxy_url)
+            logger.info(f"Browser configured with proxy: {parsed.hostname}:{parsed.port}")
+            if parsed.username and parsed.password:
+                # Format: user:pass@host:port
+                return f"{parsed.username}:{parsed.password}@{parsed.hostname}:{parsed.port}"
+            return f"{parsed.hostname}:{parsed.port}"
+        except Exception as e:
+            logger.warning(f"Failed to parse proxy URL: {e}")
+            return None
+
     def _get_stealth_chrome_args(self) -> str:
         """
         Get advanced Chrome arguments for stealth mode
         These help avoid detection by anti-bot systems
         """
-        args = [
-            # Disable automation flags
-            '--disable-blink-features=AutomationControlled',
-
-            # Disable various Chrome features that can reveal automation
-            '--disable-dev-shm-usage',
-            '--disable-gpu',
-            '--disable-features=IsolateOrigins,site-per-process',
-            '--disable-web-security',
-
-            # Reduce bot detection surface
-            '--no-first-run',
-            '--no-service-autorun',
-            '--password-store=basic',
-            '--system-developer-mode',
-
-            # Performance optimizations
-            '--disable-background-timer-throttling',
-            '--disable-backgrounding-occluded-windows',
-            '--disable-renderer-backgrounding',
-
-            # Disable notifications and infobars
-            '--disable-infobars',
-            '--disable-notifications',
-            '--disable-popup-blocking',
-
-            # Randomize some settings to avoid fingerprinting
-            f'--window-size={random.randint(1024, 1920)},{random.randint(768, 1080)}',
-
-            # Additional stealth options
-            '--disable-browser-side-navigation',
-            '--disable-component-extensions-with-background-pages',
-            '--disable-default-apps',
-            '--disable-extensions',
-            '--disable-hang-monitor',
-            '--disable-prompt-on-repost',
-            '--disable-sync',
-            '--enable-features=NetworkService,NetworkServiceInProcess',
-            '--force-color-profile=srgb',
-            '--hide-scrollbars',
-            '--metrics-recording-only',
-            '--mute-audio',
-            '--no-default-browser-check',
-            '--no-sandbox',
-        ]
-
-        return ','.join(args)
+        # Randomize window size to avoid fingerprinting
+        return f"{STEALTH_CHROME_ARGS},--window-size={random.randint(1024, 1920)},{random.randint(768, 1080)}"
 
     def _init_browser(self, headless: bool = True):
         """Initialize SeleniumBase with UC mode and advanced stealth options"""
@@ -104,33 +259,10 @@ class IndeedScraper(BaseScraper):
         # Close existing browser if any
         self._close_browser()
 
-        # Get proxy configuration
-        proxy_url = self.config.get('proxy') or os.getenv('HTTPS_PROXY') or os.getenv('HTTP_PROXY')
-
-        # Parse proxy for SeleniumBase format
-        proxy_arg = None
-        if proxy_url:
-            try:
-                from urllib.parse import urlparse
-                parsed = urlparse(proxy_url)
-                if parsed.username and parsed.password:
-                    # Format: user:pass@host:port
-                    proxy_arg = f"{parsed.username}:{parsed.password}@{parsed.hostname}:{parsed.port}"
-                else:
-                    proxy_arg = f"{parsed.hostname}:{parsed.port}"
-                logger.info(f"Browser configured with proxy: {parsed.hostname}:{parsed.port}")
-            except Exception as e:
-                logger.warning(f"Failed to parse proxy URL: {e}")
-                proxy_arg = None
-
         logger.info(f"Initializing SeleniumBase UC mode with stealth enhancements (headless={headless})...")
 
         # Randomize viewport to avoid fingerprinting
-        viewports = [
-            (1920, 1080), (1366, 768), (1440, 900), (1536, 864),
-            (1600, 900), (1280, 720), (2560, 1440)
-        ]
-        width, height = random.choice(viewports)
+        width, height = random.choice(VIEWPORTS)
 
         # Create SB context with UC mode and stealth options
         sb_kwargs = {
@@ -143,8 +275,8 @@ class IndeedScraper(BaseScraper):
             'agent': self._get_random_user_agent(),  # Random user agent
         }
 
-        if proxy_arg:
-            sb_kwargs['proxy'] = proxy_arg
+        if self._proxy_arg:
+            sb_kwargs['proxy'] = self._proxy_arg
 
         # Store kwargs and viewport for creating new sessions
         self._sb_kwargs = sb_kwargs
@@ -155,20 +287,70 @@ class IndeedScraper(BaseScraper):
 
     def _close_browser(self):
         """Close SeleniumBase browser"""
-        if self.sb:
+        if self._sb_context:
             try:
-                self.sb.__exit__(None, None, None)
+                self._sb_context.__exit__(None, None, None)
             except Exception:
                 pass
-            self.sb = None
+            self._sb_context = None
+        self.sb = None
         self.request_count = 0
 
+    def _get_session(self):
+        """
+        Get the shared SeleniumBase session, starting a new browser when none
+        is open or the current one has served max_requests_per_session pages
+        """
+        from seleniumbase import SB
+
+        if self.sb is None or self.request_count >= self.max_requests_per_session:
+            self._close_browser()
+            logger.info("Starting new browser session")
+            self._sb_context = SB(**self._sb_kwargs)
+            self.sb = self._sb_context.__enter__()
+
+        self.request_count += 1
+        return self.sb
+
     def _random_delay(self, min_sec: float, max_sec: float):
-        """Add random delay to simulate human behavior"""
+        """Add random delay to simulate human behavior (blocking; for browser worker threads)"""
         delay = random.uniform(min_sec, max_sec)
         logger.debug(f"Waiting {delay:.1f}s...")
         time.sleep(delay)
 
+    async def _wait_for_rate_limit(self):
+        """Sleep until a page request token is available (no-op when rps is None/0)"""
+        if not self._page_rps:
+            return
+
+        async with self._rate_lock:
+            now = time.monotonic()
+            self._page_tokens = min(self._page_burst, self._page_tokens + (now - self._page_tokens_at) * self._page_rps)
+            self._page_tokens_at = now
+
+            if self._page_tokens < 1:
+                wait = (1 - self._page_tokens + random.uniform(0, PAGE_WAIT_JITTER)) / self._page_rps
+                logger.debug(f"Rate limited, waiting {wait:.1f}s for next page...")
+                await asyncio.sleep(wait)
+                self._page_tokens = 1.0
+                self._page_tokens_at = time.monotonic()
+
+            self._page_tokens -= 1
+
+    async def _arandom_delay(self, min_sec: float, max_sec: float):
+        """Add random delay between pages without blocking the event loop"""
+        delay = random.uniform(min_sec, max_sec)
+        logger.debug(f"Waiting {delay:.1f}s...")
+        await asyncio.sleep(delay)
+
+    def _get_mosaic_script(self, sb) -> Optional[str]:
+        """Text of the page's mosaic <script> tag, or None if there isn't one"""
+        try:
+            return sb.execute_script(MOSAIC_SCRIPT_JS)
+        except Exception as e:
+            logger.warning(f"Failed to read mosaic script: {e}")
+            return None
+
     def _extract_jobs_from_mosaic(self, html: str) -> tuple[List[Dict[str, Any]], int]:
         """
         Extract job data from embedded mosaic JSON instead of DOM parsing.
@@ -178,19 +360,20 @@ class IndeedScraper(BaseScraper):
             Tuple of (jobs_list, total_count)
         """
         try:
-            match = re.search(MOSAIC_PATTERN, html, re.DOTALL)
-            if not match:
+            start = html.find(MOSAIC_PREFIX)
+            assignment = MOSAIC_ASSIGN_RE.match(html, start + len(MOSAIC_PREFIX)) if start != -1 else None
+            if not assignment:
                 logger.warning("Mosaic JSON data not found in page")
                 return [], 0
 
-            data = json.loads(match.group(1))
+            data, _ = _decode_mosaic(html, assignment.end())
 
             # Extract job results
-            jobs_data = data.get('metaData', {}).get('mosaicProviderJobCardsModel', {})
-            jobs_list = jobs_data.get('results', [])
+            jobs_data = (data.get('metaData') or EMPTY_DICT).get('mosaicProviderJobCardsModel') or EMPTY_DICT
+            jobs_list = jobs_data.get('results') or []
 
             # Get total count from tier summaries
-            tier_summaries = jobs_data.get('tierSummaries', [])
+            tier_summaries = jobs_data.get('tierSummaries') or ()
             total_count = sum(tier.get('jobCount', 0) for tier in tier_summaries)
 
             logger.info(f"Extracted {len(jobs_list)} jobs from mosaic JSON (total available: {total_count})")
@@ -203,34 +386,48 @@ class IndeedScraper(BaseScraper):
             logger.error(f"Error extracting mosaic data: {e}")
             return [], 0
 
-    def _parse_mosaic_job(self, job_data: Dict[str, Any]) -> Optional[JobListing]:
-        """Parse a single job from mosaic JSON data"""
+    def _jobs_from_mosaic(self, jobs_data: List[Dict[str, Any]], page_num: int) -> List[JobListing]:
+        """Parse a page's mosaic results into JobListings sharing one scrape time"""
+        now = datetime.now()
+        jobs = []
+        for job_data in jobs_data:
+            job = self._parse_mosaic_job(job_data, now)
+            if job:
+                jobs.append(job)
+
+        logger.info(f"Successfully extracted {len(jobs)} jobs from mosaic JSON on page {page_num}")
+        return jobs
+
+    def _parse_mosaic_job(self, job_data: Dict[str, Any], now: Optional[datetime] = None) -> Optional[JobListing]:
+        """Parse a single job from mosaic JSON data (now: scrape time shared by the page)"""
+        now = now or datetime.now()
         try:
-            job_key = job_data.get('jobkey', '')
-            title = job_data.get('title', job_data.get('displayTitle', ''))
-            company = job_data.get('company', 'Unknown')
-            location = job_data.get('formattedLocation', job_data.get('jobLocationCity', 'Remote'))
+            # Fallback keys are only looked up when the primary one is missing/empty
+            get = job_data.get
+            job_key = get('jobkey') or ''
+            title = get('title') or get('displayTitle') or ''
+            company = get('company') or 'Unknown'
+            location = get('formattedLocation') or get('jobLocationCity') or 'Remote'
 
             # Build job URL
             url = f"{self.base_url}/viewjob?jk={job_key}" if job_key else ""
 
             # Extract description snippet
-            description = job_data.get('snippet', '')
+            description = get('snippet')
             if not description:
                 # Try to build from snippet items
-                snippet_items = job_data.get('jobSnippetHtmlItems', [])
-                description = ' '.join(snippet_items)
+                description = ' '.join(get('jobSnippetHtmlItems') or ())
 
             # Parse date - Indeed provides relative dates like "3 days ago"
-            date_str = job_data.get('formattedRelativeTime', '')
-            posted_date = self._parse_posted_date(date_str)
+            date_str = get('formattedRelativeTime') or ''
+            posted_date = self._parse_posted_date(date_str, now)
 
             # Check if remote
-            remote_location = job_data.get('remoteLocation', False)
+            remote_location = get('remoteLocation')
             remote_type = "Remote" if remote_location or "remote" in location.lower() else None
 
             # Extract salary if available
-            salary_info = job_data.get('extractedSalary', {})
+            salary_info = get('extractedSalary')
             salary_min = None
             salary_max = None
             if salary_info:
@@ -247,7 +444,7 @@ class IndeedScraper(BaseScraper):
                 posted_date=posted_date,
                 board_source=JobBoard.INDEED,
                 remote_type=remote_type,
-                scraped_at=datetime.now(),
+                scraped_at=now,
                 salary_min=salary_min,
                 salary_max=salary_max,
             )
@@ -266,6 +463,10 @@ class IndeedScraper(BaseScraper):
         """
         Search for jobs on Indeed using SeleniumBase UC mode
 
+        Pages are fetched over plain HTTP. The browser is only started when
+        the first page is challenged, and later pages then reuse its
+        Cloudflare clearance (see _search_remaining_pages).
+
         Args:
             query: Job search query (e.g., "software engineer")
             location: Location filter (default: "Remote")
@@ -284,48 +485,216 @@ class IndeedScraper(BaseScraper):
         self._init_browser(headless=headless)
 
         jobs = []
-        page_num = 0
-        max_pages = min((max_results // 10) + 1, 10)  # Indeed shows ~10 jobs per page
-
-        from seleniumbase import SB
+        max_pages = self.max_pages(max_results)
 
         try:
-            while len(jobs) < max_results and page_num < max_pages:
-                # Build search URL
-                params = {
-                    'q': query,
-                    'l': location,
-                    'start': page_num * 10,
-                }
+            url = self._build_search_url(query, location, 0, remote_only)
+
+            # Try plain HTTP first; the mosaic data is in the served HTML, so
+            # the browser is only needed once Cloudflare steps in
+            async with self._http_client() as client:
+                jobs = await self._fetch_page_over_http(client, url, 0) or []
+                if jobs and not self.is_last_page(jobs) and len(jobs) < max_results and max_pages > 1:
+                    jobs.extend(await self._search_remaining_pages(client, query, location, remote_only, max_pages))
+
+            if not jobs:
+                # Challenged (or soft-blocked into an empty page): pass
+                # Cloudflare in the browser and reuse its clearance after
+                logger.info("Page 0 not available over HTTP, using browser...")
+                await self._wait_for_rate_limit()
+                jobs, cookies = await asyncio.to_thread(self._scrape_page_in_session, url, 0)
+
+                if not jobs:
+                    logger.info("No more results on page 0")
+                elif not self.is_last_page(jobs) and len(jobs) < max_results and max_pages > 1:
+                    async with self._http_client(cookies) as client:
+                        jobs.extend(await self._search_remaining_pages(client, query, location, remote_only, max_pages))
 
-                if remote_only:
-                    params['sc'] = '0kf:attr(DSQF7);'  # Remote filter
+        except Exception as e:
+            logger.error(f"Search failed: {type(e).__name__}: {e}")
+            logger.exception("Full traceback:")
+        finally:
+            self._close_browser()
 
-                url = f"{self.base_url}/jobs?{urlencode(params)}"
-                logger.info(f"Scraping page {page_num}: {url}")
+        logger.info(f"Found {len(jobs)} jobs from Indeed")
+        return jobs[:max_results]
 
-                # Create fresh browser context for better anti-detection
-                # This helps avoid session-based tracking
-                with SB(**self._sb_kwargs) as sb:
-                    page_jobs = self._scrape_page_with_uc(sb, url, page_num)
+    async def search_page(
+        self,
+        query: str,
+        location: str,
+        page_num: int,
+        remote_only: bool = True
+    ) -> List[JobListing]:
+        """
+        Scrape a single Indeed results page
 
-                if not page_jobs:
-                    logger.info(f"No more results on page {page_num}")
-                    break
+        Like search(), the page is fetched over plain HTTP first, with one
+        client shared by every page. A challenged page is scraped in the
+        shared browser session (one page at a time, in a worker thread), and
+        its cookies are copied into the client for the pages still to come.
+        Pages may be scraped concurrently with asyncio.gather; the page
+        token bucket still paces them.
 
-                jobs.extend(page_jobs)
-                page_num += 1
+        Args:
+            query: Job search query
+            location: Location filter
+            page_num: Zero-based results page number
+            remote_only: Filter for remote jobs only
 
-                # Longer delay between pages (15-30s based on research)
-                if page_num < max_pages and len(jobs) < max_results:
-                    self._random_delay(15, 30)
+        Returns:
+            List of JobListing objects found on the page
+        """
+        if self._sb_kwargs is None:
+            self._init_browser(headless=self.config.get('headless', True))
+
+        if self._page_client is None:
+            self._page_client = self._http_client()
+
+        url = self._build_search_url(query, location, page_num, remote_only)
+        page_jobs = await self._fetch_page_over_http(self._page_client, url, page_num)
+        if page_jobs is None:
+            # Back off after a challenge (15-30s based on research)
+            await self._arandom_delay(15, 30)
+            page_jobs = await self._scrape_page_in_browser(self._page_client, url, page_num)
+        return page_jobs
+
+    def max_pages(self, max_results: int) -> int:
+        """Number of results pages needed to collect max_results jobs"""
+        return min((max_results // self.jobs_per_page) + 1, self.max_pages_per_search)
+
+    def _build_search_url(self, query: str, location: str, page_num: int, remote_only: bool) -> str:
+        """Build the Indeed search URL for a results page"""
+        params = {
+            'q': query,
+            'l': location,
+            'start': page_num * self.jobs_per_page,
+        }
 
-        except Exception as e:
-            logger.error(f"Search failed: {type(e).__name__}: {e}")
-            logger.exception("Full traceback:")
+        if remote_only:
+            params['sc'] = '0kf:attr(DSQF7);'  # Remote filter
 
-        logger.info(f"Found {len(jobs)} jobs from Indeed")
-        return jobs[:max_results]
+        return f"{self.base_url}/jobs?{urlencode(params)}"
+
+    async def _search_remaining_pages(
+        self,
+        client: httpx.AsyncClient,
+        query: str,
+        location: str,
+        remote_only: bool,
+        max_pages: int
+    ) -> List[JobListing]:
+        """
+        Scrape pages 1..max_pages-1 after page 0 has passed Cloudflare
+
+        Pages are fetched in order over plain HTTP with the client that got
+        page 0 through (carrying the browser's clearance cookies if it took
+        the browser), stopping at the first empty or short page so no requests
+        are spent past the end of the results. Any page that gets challenged
+        is scraped in the browser instead, and the browser's cookies are then
+        copied into the client for the pages after it.
+        """
+        jobs = []
+        for page_num in range(1, max_pages):
+            # Human-paced gap between pages (15-30s based on research); the
+            # token bucket only caps the rate on top of this
+            await self._arandom_delay(15, 30)
+
+            url = self._build_search_url(query, location, page_num, remote_only)
+            page_jobs = await self._fetch_page_over_http(client, url, page_num)
+
+            if page_jobs is None:
+                # Back off after a challenge (15-30s based on research)
+                await self._arandom_delay(15, 30)
+                page_jobs = await self._scrape_page_in_browser(client, url, page_num)
+
+            if not page_jobs:
+                logger.info(f"No more results on page {page_num}")
+                break
+
+            jobs.extend(page_jobs)
+
+            if self.is_last_page(page_jobs):
+                logger.info(f"Page {page_num} is the last page of results")
+                break
+
+        return jobs
+
+    async def _scrape_page_in_browser(self, client: httpx.AsyncClient, url: str, page_num: int) -> List[JobListing]:
+        """
+        Scrape a page the HTTP client couldn't get in the shared browser session
+
+        On success the browser's fresh clearance is copied into the client,
+        so the pages after this one don't hit the same challenge.
+        """
+        await self._wait_for_rate_limit()
+        page_jobs, cookies = await asyncio.to_thread(self._scrape_page_in_session, url, page_num)
+        if page_jobs:
+            client.cookies.update(cookies)
+        return page_jobs
+
+    def _http_client(self, cookies: Optional[Dict[str, str]] = None) -> httpx.AsyncClient:
+        """HTTP/2 client presenting the browser's user agent, reused across a search's pages"""
+        return httpx.AsyncClient(
+            headers={'User-Agent': self._sb_kwargs['agent'], **HTTP_PAGE_HEADERS},
+            cookies=cookies,
+            proxies=self._proxy_url,
+            http2=True,
+            follow_redirects=True,
+            timeout=HTTP_PAGE_TIMEOUT,
+        )
+
+    @staticmethod
+    def _session_cookies(sb) -> Dict[str, str]:
+        """Cookies of a browser session, by name"""
+        return {cookie['name']: cookie['value'] for cookie in sb.get_cookies()}
+
+    async def _fetch_page_over_http(self, client: httpx.AsyncClient, url: str, page_num: int) -> Optional[List[JobListing]]:
+        """
+        Fetch and parse a results page without the browser
+
+        Returns:
+            Jobs on the page, or None if the request was challenged or failed,
+            or served a page with neither mosaic data nor job cards (likely a
+            soft block), and the page needs the browser
+        """
+        await self._wait_for_rate_limit()
+        logger.info(f"Fetching page {page_num} over HTTP: {url}")
+        try:
+            response = await client.get(url)
+        except httpx.HTTPError as e:
+            logger.warning(f"HTTP fetch of page {page_num} failed: {type(e).__name__}: {e}")
+            return None
+
+        if response.status_code != 200 or response.headers.get('cf-mitigated') == 'challenge':
+            logger.warning(f"Page {page_num} was challenged over HTTP (status {response.status_code}), using browser")
+            return None
+
+        html = response.text
+        jobs_data, _ = self._extract_jobs_from_mosaic(html)
+        if jobs_data:
+            return self._jobs_from_mosaic(jobs_data, page_num)
+
+        logger.info("Mosaic JSON not found, falling back to DOM parsing...")
+        jobs = self._parse_jobs_from_dom(html, page_num, save_debug=False)
+        if not jobs:
+            logger.warning(f"Page {page_num} had no jobs over HTTP, using browser")
+            return None
+        return jobs
+
+    def _scrape_page_in_session(self, url: str, page_num: int) -> Tuple[List[JobListing], Dict[str, str]]:
+        """
+        Scrape a results page in the shared session, rotating the browser every few pages
+
+        Returns:
+            Tuple of (jobs, cookies), with the cookies read from the same
+            browser that scraped the page, before another worker can rotate it
+        """
+        with self._session_lock:
+            logger.info(f"Scraping page {page_num}: {url}")
+            sb = self._get_session()
+            jobs = self._scrape_page_with_uc(sb, url, page_num)
+            return jobs, self._session_cookies(sb)
 
     def _simulate_human_behavior(self, sb):
         """
@@ -333,58 +702,42 @@ class IndeedScraper(BaseScraper):
         - Random scrolling patterns
         - Random mouse movements
         - Variable reading times
+
+        The pattern is planned up front and replayed in the page by one
+        script call, then we wait out its duration here.
         """
         try:
             # Simulate reading time at top of page
             self._random_delay(1, 3)
 
-            # Random scrolling pattern - humans don't scroll linearly
+            steps = []
+            elapsed = 0.0
+
+            # Random scrolling pattern - humans don't scroll linearly, and
+            # pause for variable reading times between scrolls
             scroll_positions = [
                 random.randint(200, 400),
                 random.randint(500, 800),
                 random.randint(900, 1200),
             ]
-
             for position in scroll_positions:
-                try:
-                    # Scroll to position with some randomness
-                    actual_position = position + random.randint(-50, 50)
-                    sb.execute_script(f"window.scrollTo({{top: {actual_position}, behavior: 'smooth'}});")
-
-                    # Variable pause - humans read at different speeds
-                    self._random_delay(0.5, 2.0)
-                except Exception:
-                    # Continue even if scrolling fails
-                    pass
+                steps.append([int(elapsed * 1000), 'scroll', position + random.randint(-50, 50), 0])
+                elapsed += random.uniform(0.5, 2.0)
 
             # Scroll back up a bit (humans often do this)
             if random.random() > 0.5:
-                try:
-                    sb.execute_script(f"window.scrollTo({{top: {random.randint(100, 400)}, behavior: 'smooth'}});")
-                    self._random_delay(0.5, 1.5)
-                except Exception:
-                    pass
+                steps.append([int(elapsed * 1000), 'scroll', random.randint(100, 400), 0])
+                elapsed += random.uniform(0.5, 1.5)
 
             # Random mouse movements (if not headless)
             if not self._sb_kwargs.get('headless', True):
-                try:
-                    # Move mouse to random positions
-                    for _ in range(random.randint(2, 5)):
-                        x = random.randint(100, 800)
-                        y = random.randint(100, 600)
-                        sb.execute_script(f"""
-                            var event = new MouseEvent('mousemove', {{
-                                'view': window,
-                                'bubbles': true,
-                                'cancelable': true,
-                                'clientX': {x},
-                                'clientY': {y}
-                            }});
-                            document.dispatchEvent(event);
-                        """)
-                        time.sleep(random.uniform(0.1, 0.3))
-                except Exception:
-                    pass
+                for _ in range(random.randint(2, 5)):
+                    steps.append([int(elapsed * 1000), 'mousemove', random.randint(100, 800), random.randint(100, 600)])
+                    elapsed += random.uniform(0.1, 0.3)
+
+            sb.execute_script(HUMAN_BEHAVIOR_JS, steps)
+            logger.debug(f"Waiting {elapsed:.1f}s for simulated browsing...")
+            time.sleep(elapsed)
 
             logger.debug("Simulated human browsing behavior")
 
@@ -395,46 +748,16 @@ class IndeedScraper(BaseScraper):
     def _inject_stealth_scripts(self, sb):
         """
         Inject JavaScript to override common bot detection methods
+
+        Off unless config['extra_stealth_overrides'] is set: UC mode already
+        patches navigator.webdriver before page load, and re-defining
+        properties in page context can itself be detected.
         """
-        try:
-            # Override navigator.webdriver
-            sb.execute_script("""
-                Object.defineProperty(navigator, 'webdriver', {
-                    get: () => undefined
-                });
-            """)
-
-            # Override chrome detection
-            sb.execute_script("""
-                window.navigator.chrome = {
-                    runtime: {},
-                };
-            """)
-
-            # Override permissions query
-            sb.execute_script("""
-                const originalQuery = window.navigator.permissions.query;
-                window.navigator.permissions.query = (parameters) => (
-                    parameters.name === 'notifications' ?
-                        Promise.resolve({ state: Notification.permission }) :
-                        originalQuery(parameters)
-                );
-            """)
-
-            # Mock plugins
-            sb.execute_script("""
-                Object.defineProperty(navigator, 'plugins', {
-                    get: () => [1, 2, 3, 4, 5],
-                });
-            """)
-
-            # Mock languages
-            sb.execute_script("""
-                Object.defineProperty(navigator, 'languages', {
-                    get: () => ['en-US', 'en'],
-                });
-            """)
+        if not self.config.get('extra_stealth_overrides', False):
+            return
 
+        try:
+            sb.execute_script(STEALTH_BUNDLE_JS)
             logger.debug("Injected stealth scripts to override bot detection")
 
         except Exception as e:
@@ -474,7 +797,8 @@ class IndeedScraper(BaseScraper):
 
                 # Check if we hit a CAPTCHA
                 page_source = sb.get_page_source()
-                if 'verify you' in page_source.lower() or 'captcha' in page_source.lower():
+                page_text = page_source.lower()
+                if any(marker in page_text for marker in CAPTCHA_MARKERS):
                     logger.error("CAPTCHA detected! Trying to solve...")
 
                     # Try UC mode's CAPTCHA handler (only works in non-headless)
@@ -496,25 +820,17 @@ class IndeedScraper(BaseScraper):
             # Additional human-like delay before extracting data
             self._random_delay(1, 3)
 
-            # Get page source
-            page_source = sb.get_page_source()
-
-            # Try to extract from mosaic JSON first (more reliable)
-            jobs_data, total_count = self._extract_jobs_from_mosaic(page_source)
+            # Try to extract from mosaic JSON first (more reliable), fetching
+            # just its script rather than the whole page source
+            mosaic_script = self._get_mosaic_script(sb)
+            jobs_data, total_count = self._extract_jobs_from_mosaic(mosaic_script or '')
 
             if jobs_data:
-                jobs = []
-                for job_data in jobs_data:
-                    job = self._parse_mosaic_job(job_data)
-                    if job:
-                        jobs.append(job)
-
-                logger.info(f"Successfully extracted {len(jobs)} jobs from mosaic JSON on page {page_num}")
-                return jobs
+                return self._jobs_from_mosaic(jobs_data, page_num)
 
             # Fallback to DOM parsing if mosaic not found
             logger.info("Mosaic JSON not found, falling back to DOM parsing...")
-            return self._parse_jobs_from_dom(page_source, page_num)
+            return self._parse_jobs_from_dom(sb.get_page_source(), page_num)
 
         except Exception as e:
             logger.error(f"Failed to scrape page {page_num}: {type(e).__name__}: {e}")
@@ -525,22 +841,37 @@ class IndeedScraper(BaseScraper):
                 pass
             return []
 
-    def _parse_jobs_from_dom(self, html: str, page_num: int) -> List[JobListing]:
-        """Fallback: Parse jobs from DOM using BeautifulSoup"""
-        soup = BeautifulSoup(html, 'html.parser')
+    def _parse_jobs_from_dom(self, html: str, page_num: int, save_debug: bool = True) -> List[JobListing]:
+        """
+        Fallback: Parse jobs from DOM using selectolax
+
+        Only a handful of fields per card are needed, so the lightweight C
+        tree from selectolax is used rather than a full BeautifulSoup tree.
+
+        Args:
+            html: Page HTML
+            page_num: Zero-based results page number (for logging)
+            save_debug: Save the page to a debug file when no cards are found
+        """
+        # Imported here so the mosaic fast path never pays for the parser
+        from selectolax.lexbor import LexborHTMLParser
+
+        tree = LexborHTMLParser(html)
 
         # Find job cards
-        job_cards = soup.find_all('div', class_=re.compile(r'job_seen_beacon'))
+        job_cards = tree.css(JOB_CARD_SELECTOR)
 
         if not job_cards:
             logger.warning(f"No job cards found on page {page_num}")
-            self._save_debug_html(html, f"no_jobs_page_{page_num}")
+            if save_debug:
+                self._save_debug_html(html, f"no_jobs_page_{page_num}")
             return []
 
+        now = datetime.now()
         jobs = []
         for card in job_cards:
             try:
-                job = self._parse_job_card_dom(card)
+                job = self._parse_job_card_dom(card, now)
                 if job:
                     jobs.append(job)
             except Exception as e:
@@ -550,37 +881,30 @@ class IndeedScraper(BaseScraper):
         logger.info(f"Parsed {len(jobs)} jobs from DOM on page {page_num}")
         return jobs
 
-    def _parse_job_card_dom(self, card) -> Optional[JobListing]:
-        """Parse a single job card from DOM (fallback method)"""
+    @staticmethod
+    def _card_text(card, selector: str) -> Optional[str]:
+        """Stripped text of the first element matching selector, if any"""
+        node = card.css_first(selector)
+        return node.text(strip=True) if node is not None else None
+
+    def _parse_job_card_dom(self, card, now: Optional[datetime] = None) -> Optional[JobListing]:
+        """Parse a single job card node from DOM (fallback method)"""
+        now = now or datetime.now()
         try:
             # Extract title and URL
-            title_elem = card.find('h2', class_='jobTitle')
-            if not title_elem:
+            title_link = card.css_first('h2.jobTitle a')
+            if title_link is None:
                 return None
 
-            title_link = title_elem.find('a')
-            if not title_link:
-                return None
-
-            title = title_link.get_text(strip=True)
-            job_key = title_link.get('data-jk') or title_link.get('id', '').replace('job_', '')
+            title = title_link.text(strip=True)
+            attributes = title_link.attributes
+            job_key = attributes.get('data-jk') or (attributes.get('id') or '').replace('job_', '')
             url = f"{self.base_url}/viewjob?jk={job_key}" if job_key else ""
 
-            # Extract company
-            company_elem = card.find('span', {'data-testid': 'company-name'})
-            company = company_elem.get_text(strip=True) if company_elem else "Unknown"
-
-            # Extract location
-            location_elem = card.find('div', {'data-testid': 'text-location'})
-            location = location_elem.get_text(strip=True) if location_elem else "Remote"
-
-            # Extract description snippet
-            desc_elem = card.find('div', class_='job-snippet')
-            description = desc_elem.get_text(strip=True) if desc_elem else ""
-
-            # Extract posted date
-            date_elem = card.find('span', class_='date')
-            posted_date = self._parse_posted_date(date_elem.get_text(strip=True) if date_elem else "")
+            company = self._card_text(card, 'span[data-testid="company-name"]') or "Unknown"
+            location = self._card_text(card, 'div[data-testid="text-location"]') or "Remote"
+            description = self._card_text(card, 'div.job-snippet') or ""
+            posted_date = self._parse_posted_date(self._card_text(card, 'span.date') or "", now)
 
             return JobListing(
                 id=job_key or None,
@@ -592,7 +916,7 @@ class IndeedScraper(BaseScraper):
                 posted_date=posted_date,
                 board_source=JobBoard.INDEED,
                 remote_type="Remote" if "remote" in location.lower() else None,
-                scraped_at=datetime.now()
+                scraped_at=now
             )
 
         except Exception as e:
@@ -609,31 +933,6 @@ class IndeedScraper(BaseScraper):
         except Exception as e:
             logger.warning(f"Failed to save debug HTML: {e}")
 
-    def _parse_posted_date(self, date_text: str) -> datetime:
-        """Parse Indeed's relative date format (e.g., '2 days ago')"""
-        date_text = date_text.lower().strip()
-
-        if not date_text or date_text == "just posted" or date_text == "today":
-            return datetime.now()
-
-        # Extract number from text
-        match = re.search(r'(\d+)', date_text)
-        if not match:
-            return datetime.now()
-
-        number = int(match.group(1))
-
-        if 'hour' in date_text:
-            return datetime.now() - timedelta(hours=number)
-        elif 'day' in date_text:
-            return datetime.now() - timedelta(days=number)
-        elif 'week' in date_text:
-            return datetime.now() - timedelta(weeks=number)
-        elif 'month' in date_text:
-            return datetime.now() - timedelta(days=number * 30)
-        else:
-            return datetime.now()
-
     async def get_job_details(self, job_url: str) -> Optional[JobListing]:
         """Get detailed job information (not implemented for MVP)"""
         logger.debug(f"Job details fetching not implemented for MVP: {job_url}")
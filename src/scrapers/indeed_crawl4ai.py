@@ -7,7 +7,6 @@ import os
 import random
 import re
 import uuid
-from datetime import datetime, timedelta
 from typing import List, Optional, Dict, Any
 from urllib.parse import urlencode, quote_plus, urlparse
 from loguru import logger
@@ -1075,37 +1074,6 @@ class IndeedCrawl4AIScraper(BaseScraper):
             remote_type=remote_type,
         )
 
-    def _parse_posted_date(self, date_text: str) -> datetime:
-        """Parse Indeed's relative date format (e.g., '2 days ago')"""
-        if not date_text:
-            return datetime.now()
-
-        date_text = date_text.lower().strip()
-
-        # Handle "PostedJust posted" or similar concatenated strings
-        date_text = date_text.replace('posted', '').strip()
-
-        if not date_text or date_text == "just" or 'today' in date_text:
-            return datetime.now()
-
-        # Extract number from text
-        match = re.search(r'(\d+)', date_text)
-        if not match:
-            return datetime.now()
-
-        number = int(match.group(1))
-
-        if 'hour' in date_text:
-            return datetime.now() - timedelta(hours=number)
-        elif 'day' in date_text:
-            return datetime.now() - timedelta(days=number)
-        elif 'week' in date_text:
-            return datetime.now() - timedelta(weeks=number)
-        elif 'month' in date_text:
-            return datetime.now() - timedelta(days=number * 30)
-        else:
-            return datetime.now()
-
     def _parse_salary(self, item: Dict[str, Any]) -> tuple[Optional[float], Optional[float]]:
         """Parse salary information from extraction item"""
         # Check for pre-parsed values (from LLM extraction)
@@ -4,12 +4,15 @@ import json
 import os
 import random
 import re
-from datetime import datetime, timedelta
-from typing import List, Optional, Dict, Any
+from types import MappingProxyType
+from datetime import datetime
+from typing import List, Optional, Dict, Any, Tuple
 from urllib.parse import urlencode
+import orjson
 from loguru import logger
 from playwright.async_api import async_playwright, Page, Browser
 from bs4 import BeautifulSoup
+import soupsieve
 
 # Kameleo imports
 from kameleo.local_api_client import KameleoLocalApiClient
@@ -22,8 +25,47 @@ from kameleo.local_api_client.models import (
 from .base import BaseScraper
 from ..models import JobListing, JobBoard
 
-# Pattern to extract mosaic data (embedded JSON with job listings)
-MOSAIC_PATTERN = r'window\.mosaic\.providerData\["mosaic-provider-jobcards"\]\s*=\s*({.*?});'
+# Assignment of the mosaic data (embedded JSON with job listings); the
+# object itself is decoded in place rather than matched by a regex
+MOSAIC_PREFIX = 'window.mosaic.providerData["mosaic-provider-jobcards"]'
+MOSAIC_ASSIGN_RE = re.compile(r'\s*=\s*')
+_JSON_DECODER = json.JSONDecoder()
+
+# Shared read-only default for missing nested mosaic objects
+EMPTY_DICT = MappingProxyType({})
+
+# DOM fallback selectors, compiled once by soupsieve (bs4's CSS engine)
+# rather than walking each card with a chain of find() calls
+JOB_CARD_SEL = soupsieve.compile('div.job_seen_beacon')
+TITLE_LINK_SEL = soupsieve.compile('h2.jobTitle a')
+COMPANY_SEL = soupsieve.compile('span[data-testid="company-name"]')
+COMPANY_LINK_SEL = soupsieve.compile('a[data-testid="company-name"]')
+CMP_LINK_SEL = soupsieve.compile('a[href*="/cmp/"]')
+LOCATION_SEL = soupsieve.compile('div[data-testid="text-location"]')
+SNIPPET_SEL = soupsieve.compile('div.job-snippet')
+DATE_SEL = soupsieve.compile('span.date')
+SALARY_SEL = soupsieve.compile('div[class*="salary-snippet"]')
+
+
+def _decode_mosaic(html: str, start: int) -> Tuple[Any, int]:
+    """
+    Decode the mosaic object starting at html[start]
+
+    The object normally fills the rest of its <script> tag, which orjson
+    parses fastest; if other statements follow it, the stdlib decoder
+    finds where the object ends instead.
+
+    Returns:
+        Tuple of (decoded object, end offset in html)
+    """
+    end = html.find('</script>', start)
+    if end == -1:
+        end = len(html)
+    candidate = html[start:end].rstrip().rstrip(';')
+    try:
+        return orjson.loads(candidate), start + len(candidate)
+    except orjson.JSONDecodeError:
+        return _JSON_DECODER.raw_decode(html, start)
 
 
 class IndeedKameleoScraper(BaseScraper):
@@ -51,6 +93,12 @@ class IndeedKameleoScraper(BaseScraper):
         if config:
             self.kameleo_port = config.get('kameleo_port', self.kameleo_port)
 
+        # Per-page bookkeeping for company website extraction, keyed by job id:
+        # Indeed company page URLs found on job cards, and mosaic jobs whose
+        # company page URL must be read from the job detail page
+        self._company_urls: Dict[str, str] = {}
+        self._jobs_needing_company_url: set = set()
+
     async def __aenter__(self):
         """Async context manager entry"""
         await self._init_browser()
@@ -334,27 +382,26 @@ class IndeedKameleoScraper(BaseScraper):
             Tuple of (jobs_list, total_count)
         """
         try:
-            match = re.search(MOSAIC_PATTERN, html, re.DOTALL)
-            if not match:
+            start = html.find(MOSAIC_PREFIX)
+            assignment = MOSAIC_ASSIGN_RE.match(html, start + len(MOSAIC_PREFIX)) if start != -1 else None
+            if not assignment:
                 logger.warning("Mosaic JSON data not found in page")
                 return [], 0
 
-            raw_json = match.group(1)
-            logger.debug(f"Raw mosaic JSON extracted (length: {len(raw_json)} chars)")
-            logger.debug(f"Raw mosaic JSON preview: {raw_json[:500]}...")
-
-            data = json.loads(raw_json)
+            data, end = _decode_mosaic(html, assignment.end())
+            logger.debug(f"Raw mosaic JSON extracted (length: {end - assignment.end()} chars)")
+            logger.debug(f"Raw mosaic JSON preview: {html[assignment.end():assignment.end() + 500]}...")
             # logger.debug(f"Parsed mosaic data keys: {list(data.keys())}")
 
             # Extract job results
-            jobs_data = data.get('metaData', {}).get('mosaicProviderJobCardsModel', {})
+            jobs_data = (data.get('metaData') or EMPTY_DICT).get('mosaicProviderJobCardsModel') or EMPTY_DICT
             # logger.debug(f"Job cards model keys: {list(jobs_data.keys())}")
 
-            jobs_list = jobs_data.get('results', [])
+            jobs_list = jobs_data.get('results') or []
             logger.debug(f"Number of job results in raw data: {len(jobs_list)}")
 
             # Get total count from tier summaries
-            tier_summaries = jobs_data.get('tierSummaries', [])
+            tier_summaries = jobs_data.get('tierSummaries') or ()
             total_count = sum(tier.get('jobCount', 0) for tier in tier_summaries)
             logger.debug(f"Tier summaries: {tier_summaries}")
 
@@ -368,8 +415,9 @@ class IndeedKameleoScraper(BaseScraper):
             logger.error(f"Error extracting mosaic data: {e}")
             return [], 0
 
-    def _parse_mosaic_job(self, job_data: Dict[str, Any]) -> Optional[JobListing]:
-        """Parse a single job from mosaic JSON data"""
+    def _parse_mosaic_job(self, job_data: Dict[str, Any], now: Optional[datetime] = None) -> Optional[JobListing]:
+        """Parse a single job from mosaic JSON data (now: scrape time shared by the page)"""
+        now = now or datetime.now()
         try:
             # Log raw job data for debugging (enable when needed)
             # logger.debug("=" * 80)
@@ -377,31 +425,32 @@ class IndeedKameleoScraper(BaseScraper):
             # logger.debug(json.dumps(job_data, indent=2, default=str))
             # logger.debug("=" * 80)
 
-            job_key = job_data.get('jobkey', '')
-            title = job_data.get('title', job_data.get('displayTitle', ''))
-            company = job_data.get('company', 'Unknown')
-            location = job_data.get('formattedLocation', job_data.get('jobLocationCity', 'Remote'))
+            # Fallback keys are only looked up when the primary one is missing/empty
+            get = job_data.get
+            job_key = get('jobkey') or ''
+            title = get('title') or get('displayTitle') or ''
+            company = get('company') or 'Unknown'
+            location = get('formattedLocation') or get('jobLocationCity') or 'Remote'
 
             # Build job URL
             url = f"{self.base_url}/viewjob?jk={job_key}" if job_key else ""
 
             # Extract description snippet
-            description = job_data.get('snippet', '')
+            description = get('snippet')
             if not description:
                 # Try to build from snippet items
-                snippet_items = job_data.get('jobSnippetHtmlItems', [])
-                description = ' '.join(snippet_items)
+                description = ' '.join(get('jobSnippetHtmlItems') or ())
 
             # Parse date - Indeed provides relative dates like "3 days ago"
-            date_str = job_data.get('formattedRelativeTime', '')
-            posted_date = self._parse_posted_date(date_str)
+            date_str = get('formattedRelativeTime') or ''
+            posted_date = self._parse_posted_date(date_str, now)
 
             # Check if remote
-            remote_location = job_data.get('remoteLocation', False)
+            remote_location = get('remoteLocation')
             remote_type = "Remote" if remote_location or "remote" in location.lower() else None
 
             # Extract salary if available
-            salary_info = job_data.get('extractedSalary', {})
+            salary_info = get('extractedSalary')
             salary_min = None
             salary_max = None
             if salary_info:
@@ -416,7 +465,7 @@ class IndeedKameleoScraper(BaseScraper):
             # Terminology:
             # - "company URL" = Indeed company detail page (e.g., indeed.com/cmp/Google)
             # - "company website" = Actual hiring company's website (e.g., www.google.com)
-            company_overview_link = job_data.get('companyOverviewLink', '')
+            company_overview_link = get('companyOverviewLink') or ''
 
             # Check if company link is available
             has_company_link = bool(company_overview_link)
@@ -431,7 +480,7 @@ class IndeedKameleoScraper(BaseScraper):
                 posted_date=posted_date,
                 board_source=JobBoard.INDEED,
                 remote_type=remote_type,
-                scraped_at=datetime.now(),
+                scraped_at=now,
                 salary_min=salary_min,
                 salary_max=salary_max,
                 company_website=None,  # Will be populated by _extract_company_website
@@ -441,7 +490,7 @@ class IndeedKameleoScraper(BaseScraper):
             # We always need to visit the job page because:
             # 1. If we have company link: need to get it with tracking parameters
             # 2. If we don't have company link: need to try extracting it from job page
-            job_listing._needs_company_url = True
+            self._jobs_needing_company_url.add(job_listing.id)
             if has_company_link:
                 logger.debug(f"Company link found in mosaic, will extract full URL with params from job page")
             else:
@@ -635,9 +684,10 @@ class IndeedKameleoScraper(BaseScraper):
             jobs_data, total_count = self._extract_jobs_from_mosaic(content)
 
             if jobs_data:
+                now = datetime.now()
                 jobs = []
                 for job_data in jobs_data:
-                    job = self._parse_mosaic_job(job_data)
+                    job = self._parse_mosaic_job(job_data, now)
                     if job:
                         jobs.append(job)
 
@@ -648,6 +698,7 @@ class IndeedKameleoScraper(BaseScraper):
                     jobs_needed = max_results - current_count
                     if jobs_needed <= 0:
                         logger.info(f"Already have {current_count} jobs, skipping company website extraction")
+                        self._forget_company_urls(jobs)
                         return jobs[:jobs_needed]  # Return empty list or remaining needed
 
                     if len(jobs) > jobs_needed:
@@ -671,10 +722,10 @@ class IndeedKameleoScraper(BaseScraper):
                     company_url = None
 
                     # Check if we have a company URL to extract from
-                    if hasattr(job, '_company_url') and job._company_url:
-                        company_url = job._company_url
+                    if job.id in self._company_urls:
+                        company_url = self._company_urls[job.id]
                         logger.debug(f"  → Got company URL from job post: {company_url}")
-                    elif hasattr(job, '_needs_company_url') and job._needs_company_url and job.url:
+                    elif job.id in self._jobs_needing_company_url and job.url:
                         # Need to extract company URL from job page first
                         try:
                             logger.debug(f"  → Extracting company URL from job page...")
@@ -705,20 +756,15 @@ class IndeedKameleoScraper(BaseScraper):
                     else:
                         logger.debug(f"  → No company URL available")
 
-                    # Clean up temporary attributes
-                    if hasattr(job, '_company_url'):
-                        delattr(job, '_company_url')
-                    if hasattr(job, '_needs_company_url'):
-                        delattr(job, '_needs_company_url')
-
+                self._forget_company_urls(jobs)
                 return jobs
 
             # Fallback to DOM parsing if mosaic not found
             logger.info("Mosaic JSON not found, falling back to DOM parsing...")
-            soup = BeautifulSoup(content, 'html.parser')
+            soup = BeautifulSoup(content, 'lxml')
 
             # Find job cards
-            job_cards = soup.find_all('div', class_=re.compile(r'job_seen_beacon'))
+            job_cards = JOB_CARD_SEL.select(soup)
 
             if not job_cards:
                 logger.warning(f"⚠️  No job cards found on page {page_num}")
@@ -742,10 +788,11 @@ class IndeedKameleoScraper(BaseScraper):
                 return []
 
             # Parse job cards from DOM
+            now = datetime.now()
             jobs = []
             for card in job_cards:
                 try:
-                    job = self._parse_job_card(card)
+                    job = self._parse_job_card(card, now)
                     if job:
                         jobs.append(job)
                 except Exception as e:
@@ -759,6 +806,7 @@ class IndeedKameleoScraper(BaseScraper):
                 jobs_needed = max_results - current_count
                 if jobs_needed <= 0:
                     logger.info(f"Already have {current_count} jobs, skipping company website extraction")
+                    self._forget_company_urls(jobs)
                     return jobs[:jobs_needed]  # Return empty list or remaining needed
 
                 if len(jobs) > jobs_needed:
@@ -782,8 +830,8 @@ class IndeedKameleoScraper(BaseScraper):
                 company_url = None
 
                 # Check if we have a company URL to extract from
-                if hasattr(job, '_company_url') and job._company_url:
-                    company_url = job._company_url
+                if job.id in self._company_urls:
+                    company_url = self._company_urls[job.id]
                 elif job.url:
                     # Need to extract company URL from job page
                     try:
@@ -813,10 +861,7 @@ class IndeedKameleoScraper(BaseScraper):
                 else:
                     logger.debug(f"  → No company URL available")
 
-                # Clean up temporary attribute
-                if hasattr(job, '_company_url'):
-                    delattr(job, '_company_url')
-
+            self._forget_company_urls(jobs)
             return jobs
 
         except Exception as e:
@@ -836,8 +881,15 @@ class IndeedKameleoScraper(BaseScraper):
             if page:
                 await page.close()
 
-    def _parse_job_card(self, card) -> Optional[JobListing]:
+    def _forget_company_urls(self, jobs: List[JobListing]):
+        """Drop the company URL bookkeeping kept for a page's jobs"""
+        for job in jobs:
+            self._company_urls.pop(job.id, None)
+            self._jobs_needing_company_url.discard(job.id)
+
+    def _parse_job_card(self, card, now: Optional[datetime] = None) -> Optional[JobListing]:
         """Parse a single job card and return JobListing"""
+        now = now or datetime.now()
         try:
             # Log raw card HTML
             # logger.debug("=" * 80)
@@ -846,14 +898,9 @@ class IndeedKameleoScraper(BaseScraper):
             # logger.debug("=" * 80)
 
             # Extract title and URL
-            title_elem = card.find('h2', class_='jobTitle')
-            if not title_elem:
-                logger.debug("No title element found with class 'jobTitle'")
-                return None
-
-            title_link = title_elem.find('a')
+            title_link = TITLE_LINK_SEL.select_one(card)
             if not title_link:
-                logger.debug("No anchor tag found in title element")
+                logger.debug("No anchor tag found in 'jobTitle' heading")
                 return None
 
             title = title_link.get_text(strip=True)
@@ -861,12 +908,12 @@ class IndeedKameleoScraper(BaseScraper):
             url = f"{self.base_url}/viewjob?jk={job_key}" if job_key else ""
 
             # Extract company
-            company_elem = card.find('span', {'data-testid': 'company-name'})
+            company_elem = COMPANY_SEL.select_one(card)
             company = company_elem.get_text(strip=True) if company_elem else "Unknown"
 
             # Extract company URL if available
             company_url = None
-            company_link = card.find('a', {'data-testid': 'company-name'}) or card.find('a', href=re.compile(r'/cmp/'))
+            company_link = COMPANY_LINK_SEL.select_one(card) or CMP_LINK_SEL.select_one(card)
             if company_link and company_link.get('href'):
                 href = company_link.get('href')
                 # Build full company URL
@@ -876,20 +923,20 @@ class IndeedKameleoScraper(BaseScraper):
                     company_url = href
 
             # Extract location
-            location_elem = card.find('div', {'data-testid': 'text-location'})
+            location_elem = LOCATION_SEL.select_one(card)
             location = location_elem.get_text(strip=True) if location_elem else "Remote"
 
             # Extract description snippet
-            desc_elem = card.find('div', class_='job-snippet')
+            desc_elem = SNIPPET_SEL.select_one(card)
             description = desc_elem.get_text(strip=True) if desc_elem else ""
 
             # Extract posted date
-            date_elem = card.find('span', class_='date')
+            date_elem = DATE_SEL.select_one(card)
             date_str = date_elem.get_text(strip=True) if date_elem else ""
-            posted_date = self._parse_posted_date(date_str)
+            posted_date = self._parse_posted_date(date_str, now)
 
             # Extract salary if available
-            salary_elem = card.find('div', class_=re.compile(r'salary-snippet'))
+            salary_elem = SALARY_SEL.select_one(card)
             salary_text = salary_elem.get_text(strip=True) if salary_elem else None
 
             job_listing = JobListing(
@@ -902,13 +949,13 @@ class IndeedKameleoScraper(BaseScraper):
                 posted_date=posted_date,
                 board_source=JobBoard.INDEED,
                 remote_type="Remote" if "remote" in location.lower() else None,
-                scraped_at=datetime.now(),
+                scraped_at=now,
                 company_website=None,  # Will be populated later
             )
 
             # Store company URL temporarily for extraction
             if company_url:
-                job_listing._company_url = company_url
+                self._company_urls[job_listing.id] = company_url
 
             # Log parsed fields
             # logger.debug("Parsed DOM job fields:")
@@ -931,31 +978,6 @@ class IndeedKameleoScraper(BaseScraper):
 
 
 
-    def _parse_posted_date(self, date_text: str) -> datetime:
-        """Parse Indeed's relative date format (e.g., '2 days ago')"""
-        date_text = date_text.lower().strip()
-
-        if not date_text or date_text == "just posted" or date_text == "today":
-            return datetime.now()
-
-        # Extract number from text
-        match = re.search(r'(\d+)', date_text)
-        if not match:
-            return datetime.now()
-
-        number = int(match.group(1))
-
-        if 'hour' in date_text:
-            return datetime.now() - timedelta(hours=number)
-        elif 'day' in date_text:
-            return datetime.now() - timedelta(days=number)
-        elif 'week' in date_text:
-            return datetime.now() - timedelta(weeks=number)
-        elif 'month' in date_text:
-            return datetime.now() - timedelta(days=number * 30)
-        else:
-            return datetime.now()
-
     async def _extract_company_url_from_job_page(self, job_url: str) -> Optional[str]:
         """
         Extract Indeed company page URL (not the actual company website) with parameters from a job detail page.
@@ -999,7 +1021,7 @@ class IndeedKameleoScraper(BaseScraper):
 
             # Get page content
             content = await page.content()
-            soup = BeautifulSoup(content, 'html.parser')
+            soup = BeautifulSoup(content, 'lxml')
 
             # Look for company profile link with full parameters
             # Indeed shows company links with various patterns
@@ -1086,7 +1108,7 @@ class IndeedKameleoScraper(BaseScraper):
 
             # Get page content
             content = await page.content()
-            soup = BeautifulSoup(content, 'html.parser')
+            soup = BeautifulSoup(content, 'lxml')
 
             # Strategy 1: Look for company website link with common patterns
             # Indeed typically shows company website in the "About" section or header
@@ -3,7 +3,7 @@ import asyncio
 import os
 import random
 import re
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import List, Optional
 from urllib.parse import urlencode, quote_plus
 from loguru import logger
@@ -389,7 +389,7 @@ class IndeedPlaywrightScraper(BaseScraper):
             content = await page.content()
 
             # Parse with BeautifulSoup first
-            soup = BeautifulSoup(content, 'html.parser')
+            soup = BeautifulSoup(content, 'lxml')
 
             # Check for actual CAPTCHA elements (more specific than just searching for the word)
             captcha_elements = soup.find_all(['div', 'iframe', 'form'],
@@ -621,7 +621,7 @@ class IndeedPlaywrightScraper(BaseScraper):
 
             # Get page content
             content = await page.content()
-            soup = BeautifulSoup(content, 'html.parser')
+            soup = BeautifulSoup(content, 'lxml')
 
             # Look for the "Link" box on the About Company page
             # Indeed typically shows company website in a div with specific patterns
@@ -722,31 +722,6 @@ class IndeedPlaywrightScraper(BaseScraper):
             logger.warning(f"   ❌ Error extracting company website: {type(e).__name__}: {e}")
             return None
 
-    def _parse_posted_date(self, date_text: str) -> datetime:
-        """Parse Indeed's relative date format (e.g., '2 days ago')"""
-        date_text = date_text.lower().strip()
-
-        if not date_text or date_text == "just posted" or date_text == "today":
-            return datetime.now()
-
-        # Extract number from text
-        match = re.search(r'(\d+)', date_text)
-        if not match:
-            return datetime.now()
-
-        number = int(match.group(1))
-
-        if 'hour' in date_text:
-            return datetime.now() - timedelta(hours=number)
-        elif 'day' in date_text:
-            return datetime.now() - timedelta(days=number)
-        elif 'week' in date_text:
-            return datetime.now() - timedelta(weeks=number)
-        elif 'month' in date_text:
-            return datetime.now() - timedelta(days=number * 30)
-        else:
-            return datetime.now()
-
     async def get_job_details(self, job_url: str) -> Optional[JobListing]:
         """Get detailed job information (not implemented for MVP)"""
         # For MVP, we use the job card data
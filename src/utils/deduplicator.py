@@ -6,6 +6,9 @@ from loguru import logger
 
 from ..models import JobListing
 
+_NON_WORD_RE = re.compile(r'[^\w\s]')
+_WHITESPACE_RE = re.compile(r'\s+')
+
 
 class JobDeduplicator:
     """Intelligent job deduplication across multiple boards"""
@@ -28,6 +31,7 @@ class JobDeduplicator:
         unique_jobs = []
         seen_ids = set()
         seen_fuzzy = set()
+        seen_urls = set()
 
         # Sort by scraped_at (newer first) to prefer fresh listings
         sorted_jobs = sorted(jobs, key=lambda j: j.scraped_at, reverse=True)
@@ -45,13 +49,17 @@ class JobDeduplicator:
                 continue
 
             # Strategy 3: URL match (some boards cross-post with same URL)
-            if JobDeduplicator._is_duplicate_url(job, unique_jobs):
+            # Compare the full URL (not just path): Indeed paths are always
+            # /viewjob and only the jk= query param differs
+            if job.url and job.url in seen_urls:
                 logger.debug(f"Duplicate (URL): {job.title} at {job.company}")
                 continue
 
             unique_jobs.append(job)
             seen_ids.add(job.id)
             seen_fuzzy.add(fuzzy_key)
+            if job.url:
+                seen_urls.add(job.url)
 
         logger.info(f"Deduplicated: {len(jobs)} -> {len(unique_jobs)} jobs")
         return unique_jobs
@@ -63,8 +71,8 @@ class JobDeduplicator:
         def normalize(text: str) -> str:
             """Normalize: lowercase, remove special chars, remove extra spaces"""
             text = text.lower()
-            text = re.sub(r'[^\w\s]', ' ', text)
-            text = re.sub(r'\s+', ' ', text).strip()
+            text = _NON_WORD_RE.sub(' ', text)
+            text = _WHITESPACE_RE.sub(' ', text).strip()
             return text
 
         title = normalize(job.title)
@@ -76,22 +84,3 @@ class JobDeduplicator:
         title = title.replace('  ', ' ').strip()
 
         return f"{company}:{title}"
-
-    @staticmethod
-    def _is_duplicate_url(job: JobListing, existing_jobs: List[JobListing]) -> bool:
-        """Check if URL already exists (handles redirects)"""
-        if not job.url:
-            return False
-
-        # For Indeed URLs with job key, compare the full URL (not just path)
-        # because path is always /viewjob but query params differ
-        for existing in existing_jobs:
-            if not existing.url:
-                continue
-
-            # Exact URL match (most reliable)
-            if job.url == existing.url:
-                logger.debug(f"URL match: {job.url}")
-                return True
-
-        return False
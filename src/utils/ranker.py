@@ -1,12 +1,17 @@
 """Job ranking algorithm"""
 from datetime import datetime
-from typing import List
+from typing import List, Optional
 from dataclasses import dataclass
 from loguru import logger
 
 from ..models import EnrichedJob
 
 
+def _rank_key(job: EnrichedJob):
+    """Sort key: score, then posting date (same order as JobStorage.get_jobs)"""
+    return job.ranking_score, job.posted_date or datetime.min
+
+
 @dataclass
 class RankingConfig:
     """Configuration for job ranking"""
@@ -82,6 +87,15 @@ class JobRanker:
 
         return round(score, 2)
 
+    def meets_threshold(self, taiwan_team_count: Optional[int]) -> bool:
+        """Whether an Asia team of this size passes min_taiwan_team"""
+        return (taiwan_team_count or 0) >= self.config.min_taiwan_team
+
+    @staticmethod
+    def sort_jobs(jobs: List[EnrichedJob]):
+        """Sort scored jobs in place by score, newest first among equal scores"""
+        jobs.sort(key=_rank_key, reverse=True)
+
     def rank_jobs(self, jobs: List[EnrichedJob]) -> List[EnrichedJob]:
         """
         Rank jobs and sort by score
@@ -93,17 +107,13 @@ class JobRanker:
             Sorted list of jobs with ranking_score set
         """
         # Filter by minimum Asia team requirement
-        filtered_jobs = [
-            job for job in jobs
-            if (job.taiwan_team_count or 0) >= self.config.min_taiwan_team
-        ]
+        ranked = [job for job in jobs if self.meets_threshold(job.taiwan_team_count)]
 
         # Calculate scores
-        for job in filtered_jobs:
+        for job in ranked:
             job.ranking_score = self.calculate_score(job)
 
-        # Sort by score (descending)
-        ranked = sorted(filtered_jobs, key=lambda x: x.ranking_score, reverse=True)
+        self.sort_jobs(ranked)
 
         logger.info(f"Ranked {len(ranked)} jobs (filtered {len(jobs) - len(ranked)} below threshold)")
         return ranked
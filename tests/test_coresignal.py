@@ -0,0 +1,83 @@
+"""Tests for Coresignal response helpers"""
+import httpx
+import pytest
+from src.enrichment import CoresignalEnricher
+
+
+@pytest.fixture
+def enricher():
+    """CoresignalEnricher with a dummy API key"""
+    return CoresignalEnricher("test-key")
+
+
+class TestExtractCity:
+    """Test city extraction from employee locations"""
+
+    def test_city_in_given_country(self, enricher):
+        """Cities should be matched case-insensitively and returned canonically"""
+        assert enricher._extract_city("new taipei city, taiwan", "Taiwan") == "Taipei"
+
+    def test_country_limits_candidates(self, enricher):
+        """Only cities in the given country should be considered"""
+        assert enricher._extract_city("Shanghai, China", "Taiwan") is None
+
+    def test_any_country_when_unspecified(self, enricher):
+        """Without a known country, cities from every country should match"""
+        assert enricher._extract_city("HONG KONG SAR") == "Hong Kong"
+        assert enricher._extract_city("Shenzhen, Guangdong", "Unknown") == "Shenzhen"
+
+    def test_missing_location(self, enricher):
+        """Empty or unrecognised locations should return None"""
+        assert enricher._extract_city(None) is None
+        assert enricher._extract_city("Remote") is None
+
+
+class TestInferWebsite:
+    """Test domain guessing from company names"""
+
+    def test_strips_legal_suffix(self, enricher):
+        """Trailing entity suffixes should be dropped"""
+        assert enricher._infer_website("Acme Inc.") == "acme.com"
+        assert enricher._infer_website("Hello, World Company") == "helloworld.com"
+
+    def test_removes_punctuation_and_spaces(self, enricher):
+        """Hyphens, spaces and punctuation should not appear in the domain"""
+        assert enricher._infer_website("Foo-Bar Labs") == "foobarlabs.com"
+        assert enricher._infer_website("AT&T") == "att.com"
+
+
+class TestGetEmployeesInAsia:
+    """Test employee search response handling"""
+
+    @pytest.mark.asyncio
+    async def test_parses_employee_records(self, enricher):
+        """Employee records should be mapped to team member dicts"""
+        payload = [
+            {'name': "Alice", 'title': "Engineer", 'location': "Taipei City, Taiwan",
+             'country': "Taiwan", 'url': "https://linkedin.com/in/alice"},
+        ]
+        enricher.client = httpx.AsyncClient(transport=httpx.MockTransport(
+            lambda request: httpx.Response(200, json=payload)
+        ))
+
+        async with enricher:
+            employees = await enricher.get_employees_in_asia("acme.com")
+
+        assert employees == [{
+            'name': "Alice",
+            'title': "Engineer",
+            'location': "Taipei City, Taiwan",
+            'city': "Taipei",
+            'country': "Taiwan",
+            'linkedin_url': "https://linkedin.com/in/alice",
+        }]
+
+    @pytest.mark.asyncio
+    async def test_api_error_returns_empty(self, enricher):
+        """Non-200 responses should yield no employees"""
+        enricher.client = httpx.AsyncClient(transport=httpx.MockTransport(
+            lambda request: httpx.Response(500, text="error")
+        ))
+
+        async with enricher:
+            assert await enricher.get_employees_in_asia("acme.com") == []
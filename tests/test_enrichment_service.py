@@ -0,0 +1,291 @@
+"""Tests for enrichment orchestration"""
+import asyncio
+import httpx
+import pytest
+from datetime import datetime
+from src.enrichment import EnrichmentService
+from src.models import JobListing, JobBoard, CompanyProfile
+from src.utils import RankingConfig
+
+
+def create_test_job(title="Software Engineer", company="Test Corp"):
+    """Helper to create test job listings"""
+    return JobListing(
+        id=None,
+        title=title,
+        company=company,
+        location="Remote",
+        description="Test job description",
+        url="https://indeed.com/viewjob?jk=abc123",
+        posted_date=datetime.now(),
+        board_source=JobBoard.INDEED,
+        scraped_at=datetime.now()
+    )
+
+
+class FakeEnricher:
+    """Stand-in for the enrichment API clients that records calls"""
+
+    def __init__(self, asia_employees=2, delay=0.01, unknown=(), failing=()):
+        self.asia_employees = asia_employees
+        self.delay = delay
+        self.unknown = set(unknown)
+        self.failing = set(failing)
+        self.profile_calls = []
+        self.employee_batches = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        pass
+
+    async def get_company_profile(self, company_name, website=None):
+        self.profile_calls.append(company_name)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(self.delay)
+        self.in_flight -= 1
+        if company_name in self.failing:
+            raise httpx.HTTPStatusError("server error", request=None, response=None)
+        if company_name in self.unknown:
+            return None
+        return CompanyProfile(id=f"id-{company_name}", name=company_name, source='peopledatalabs')
+
+    async def get_employees_in_asia(self, website):
+        return [{'name': "Employee 0", 'city': 'Taipei', 'country': 'Taiwan'}]
+
+    async def search_employees_in_asia_batch(self, company_names, countries=None):
+        self.employee_batches.append(list(company_names))
+        return {
+            company_name: [
+                {'name': f"Employee {i}", 'city': 'Taipei', 'country': 'Taiwan'}
+                for i in range(self.asia_employees)
+            ]
+            for company_name in company_names
+        }
+
+
+@pytest.fixture
+def service(tmp_path, monkeypatch):
+    """EnrichmentService with a temporary database and fake API client"""
+    monkeypatch.setenv('DATABASE_URL', f"sqlite:///{tmp_path / 'jobs.db'}")
+    enrichment_service = EnrichmentService(service='peopledatalabs', api_key='test-key')
+    enrichment_service.enricher = FakeEnricher()
+    return enrichment_service
+
+
+class TestEnrichJobs:
+    """Test EnrichmentService.enrich_jobs"""
+
+    @pytest.mark.asyncio
+    async def test_each_company_fetched_once(self, service):
+        """Jobs sharing a company should trigger a single API lookup"""
+        jobs = [
+            create_test_job(title="Engineer", company="Acme"),
+            create_test_job(title="Manager", company="Acme"),
+            create_test_job(title="Engineer", company="Globex"),
+        ]
+
+        enriched = await service.enrich_jobs(jobs, RankingConfig(min_taiwan_team=0))
+
+        assert sorted(service.enricher.profile_calls) == ["Acme", "Globex"]
+        assert len(enriched) == 3
+        assert all(job.taiwan_team_count == 2 for job in enriched)
+
+    @pytest.mark.asyncio
+    async def test_ranks_and_filters_by_asia_team(self, service):
+        """Jobs below min_taiwan_team should be dropped and the rest sorted by score"""
+        service.enricher.unknown = {"Nowhere"}
+        jobs = [create_test_job(company="Nowhere"), create_test_job(company="Acme")]
+
+        enriched = await service.enrich_jobs(jobs, RankingConfig(min_taiwan_team=1))
+
+        assert [job.company for job in enriched] == ["Acme"]
+        assert enriched[0].ranking_score > 0
+
+    @pytest.mark.asyncio
+    async def test_employee_searches_batched(self, service):
+        """Asia employees for all found companies should be requested together"""
+        service.enricher.unknown = {"Nowhere"}
+        jobs = [create_test_job(company=name) for name in ("Acme", "Globex", "Nowhere")]
+
+        await service.enrich_jobs(jobs, RankingConfig(min_taiwan_team=0))
+
+        assert [sorted(batch) for batch in service.enricher.employee_batches] == [["Acme", "Globex"]]
+
+    @pytest.mark.asyncio
+    async def test_companies_fetched_concurrently(self, service):
+        """Company lookups should overlap, bounded by max_concurrency"""
+        service.max_concurrency = 3
+        jobs = [create_test_job(company=f"Company {i}") for i in range(6)]
+
+        await service.enrich_jobs(jobs, RankingConfig(min_taiwan_team=0))
+
+        assert 1 < service.enricher.max_in_flight <= 3
+
+    @pytest.mark.asyncio
+    async def test_cached_company_skips_api(self, service):
+        """A recently enriched company should be served from the database"""
+        await service.enrich_jobs([create_test_job(company="Acme")], RankingConfig(min_taiwan_team=0))
+        service.enricher.profile_calls.clear()
+
+        enriched = await service.enrich_jobs([create_test_job(company="Acme")], RankingConfig(min_taiwan_team=0))
+
+        assert service.enricher.profile_calls == []
+        assert enriched[0].taiwan_team_count == 2
+
+    @pytest.mark.asyncio
+    async def test_enrichment_saved_to_database(self, service):
+        """Ranked results should be written back to the jobs table"""
+        job = create_test_job(company="Acme")
+        service.storage.save_jobs([job])
+
+        await service.enrich_jobs([job], RankingConfig(min_taiwan_team=0))
+
+        saved = service.storage.get_jobs(limit=1, enriched_only=True)
+        assert len(saved) == 1
+        assert saved[0].taiwan_team_count == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_lookup_does_not_abort_batch(self, service, monkeypatch):
+        """An unexpected error for one company should leave the others enriched"""
+        lookup_company = service._lookup_company
+
+        async def flaky_lookup(company_name, company_website=None):
+            if company_name == "Broken":
+                raise RuntimeError("database locked")
+            return await lookup_company(company_name, company_website)
+
+        monkeypatch.setattr(service, '_lookup_company', flaky_lookup)
+        jobs = [create_test_job(company="Broken"), create_test_job(company="Acme")]
+
+        enriched = await service.enrich_jobs(jobs, RankingConfig(min_taiwan_team=0))
+
+        counts = {job.company: job.taiwan_team_count for job in enriched}
+        assert counts == {"Broken": 0, "Acme": 2}
+
+    @pytest.mark.asyncio
+    async def test_unmatched_company_skips_api(self, service):
+        """A company the API could not find should not be looked up again soon"""
+        service.enricher.unknown = {"Nowhere"}
+        await service.enrich_jobs([create_test_job(company="Nowhere")], RankingConfig(min_taiwan_team=0))
+        service.enricher.profile_calls.clear()
+
+        enriched = await service.enrich_jobs([create_test_job(company="Nowhere")], RankingConfig(min_taiwan_team=0))
+
+        assert service.enricher.profile_calls == []
+        assert enriched[0].taiwan_team_count == 0
+
+    @pytest.mark.asyncio
+    async def test_coresignal_inferred_website_miss_not_remembered(self, service):
+        """A Coresignal miss on a guessed website should not skip a later job with the real one"""
+        service.service = 'coresignal'
+        service.enricher.unknown = {"Acme"}
+        await service.enrich_jobs([create_test_job(company="Acme")], RankingConfig(min_taiwan_team=0))
+        service.enricher.unknown.clear()
+        service.enricher.profile_calls.clear()
+
+        job = create_test_job(company="Acme")
+        job.company_website = "acmewidgets.io"
+        await service.enrich_jobs([job], RankingConfig(min_taiwan_team=0))
+
+        assert service.enricher.profile_calls == ["Acme"]
+
+    @pytest.mark.asyncio
+    async def test_coresignal_supplied_website_miss_remembered(self, service):
+        """A Coresignal miss on a website the job supplied should be remembered"""
+        service.service = 'coresignal'
+        service.enricher.unknown = {"Acme"}
+        job = create_test_job(company="Acme")
+        job.company_website = "acmewidgets.io"
+        await service.enrich_jobs([job], RankingConfig(min_taiwan_team=0))
+        service.enricher.profile_calls.clear()
+
+        await service.enrich_jobs([job], RankingConfig(min_taiwan_team=0))
+
+        assert service.enricher.profile_calls == []
+
+    @pytest.mark.asyncio
+    async def test_api_error_not_remembered_as_miss(self, service):
+        """Failed lookups should be retried on the next run"""
+        service.enricher.failing = {"Acme"}
+        await service.enrich_jobs([create_test_job(company="Acme")], RankingConfig(min_taiwan_team=0))
+        service.enricher.failing.clear()
+        service.enricher.profile_calls.clear()
+
+        enriched = await service.enrich_jobs([create_test_job(company="Acme")], RankingConfig(min_taiwan_team=0))
+
+        assert service.enricher.profile_calls == ["Acme"]
+        assert enriched[0].taiwan_team_count == 2
+
+
+class TestLazyClient:
+    """Test that the API client is only created when needed"""
+
+    @pytest.mark.asyncio
+    async def test_all_cached_run_skips_client(self, tmp_path, monkeypatch):
+        """A run served entirely from the cache should never build an API client"""
+        monkeypatch.setenv('DATABASE_URL', f"sqlite:///{tmp_path / 'jobs.db'}")
+        service = EnrichmentService(api_key='test-key')
+        service.storage.save_company(CompanyProfile(
+            id="acme", name="Acme", source="peopledatalabs", enriched_at=datetime.now()
+        ))
+
+        async with service:
+            enriched = await service.enrich_jobs([create_test_job(company="Acme")], RankingConfig(min_taiwan_team=0))
+
+        assert service.enricher is None
+        assert enriched[0].company_id == "acme"
+
+    @pytest.mark.asyncio
+    async def test_client_created_on_cache_miss(self, tmp_path, monkeypatch):
+        """Uncached companies should open the configured client"""
+        monkeypatch.setenv('DATABASE_URL', f"sqlite:///{tmp_path / 'jobs.db'}")
+        service = EnrichmentService(api_key='test-key')
+        monkeypatch.setattr(service, '_enricher_class', lambda api_key, proxy=None: FakeEnricher())
+
+        async with service:
+            await service.enrich_jobs([create_test_job(company="Acme")], RankingConfig(min_taiwan_team=0))
+
+        assert service.enricher.profile_calls == ["Acme"]
+
+
+class TestConcurrencyConfig:
+    """Test enrichment concurrency configuration"""
+
+    def test_env_var_sets_default(self, tmp_path, monkeypatch):
+        """ENRICHMENT_MAX_CONCURRENCY should apply when no argument is given"""
+        monkeypatch.setenv('DATABASE_URL', f"sqlite:///{tmp_path / 'jobs.db'}")
+        monkeypatch.setenv('ENRICHMENT_MAX_CONCURRENCY', '3')
+
+        service = EnrichmentService(api_key='test-key')
+
+        assert service.max_concurrency == 3
+
+    def test_argument_overrides_env_var(self, tmp_path, monkeypatch):
+        """An explicit max_concurrency should win over the environment"""
+        monkeypatch.setenv('DATABASE_URL', f"sqlite:///{tmp_path / 'jobs.db'}")
+        monkeypatch.setenv('ENRICHMENT_MAX_CONCURRENCY', '3')
+
+        service = EnrichmentService(api_key='test-key', max_concurrency=5)
+
+        assert service.max_concurrency == 5
+
+    @pytest.mark.parametrize("value", ['0', '-2'])
+    def test_rejects_values_below_one(self, tmp_path, monkeypatch, value):
+        """A concurrency below 1 would hang enrichment, so it should fail fast"""
+        monkeypatch.setenv('DATABASE_URL', f"sqlite:///{tmp_path / 'jobs.db'}")
+        monkeypatch.setenv('ENRICHMENT_MAX_CONCURRENCY', value)
+
+        with pytest.raises(ValueError, match="ENRICHMENT_MAX_CONCURRENCY"):
+            EnrichmentService(api_key='test-key')
+
+    def test_rejects_zero_argument(self, tmp_path, monkeypatch):
+        """An explicit max_concurrency of 0 should not fall back to the default"""
+        monkeypatch.setenv('DATABASE_URL', f"sqlite:///{tmp_path / 'jobs.db'}")
+
+        with pytest.raises(ValueError):
+            EnrichmentService(api_key='test-key', max_concurrency=0)
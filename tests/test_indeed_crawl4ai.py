@@ -266,10 +266,10 @@ class TestCrawl4AIScraperFactory:
     """Test the scraper factory function"""
 
     def test_get_indeed_scraper_playwright(self):
-        """Test getting Playwright scraper"""
+        """Test getting default SeleniumBase scraper"""
         from src.scrapers import get_indeed_scraper, IndeedScraper
 
-        scraper = get_indeed_scraper(use_crawl4ai=False)
+        scraper = get_indeed_scraper(scraper_type='seleniumbase')
         assert isinstance(scraper, IndeedScraper)
 
     @pytest.mark.skipif(not CRAWL4AI_AVAILABLE, reason="crawl4ai not installed")
@@ -277,7 +277,7 @@ class TestCrawl4AIScraperFactory:
         """Test getting Crawl4AI scraper"""
         from src.scrapers import get_indeed_scraper
 
-        scraper = get_indeed_scraper(use_crawl4ai=True)
+        scraper = get_indeed_scraper(scraper_type='crawl4ai')
         assert isinstance(scraper, IndeedCrawl4AIScraper)
 
     def test_get_indeed_scraper_crawl4ai_not_installed(self):
@@ -288,7 +288,7 @@ class TestCrawl4AIScraperFactory:
             pytest.skip("crawl4ai is installed, cannot test missing scenario")
 
         with pytest.raises(ImportError):
-            get_indeed_scraper(use_crawl4ai=True)
+            get_indeed_scraper(scraper_type='crawl4ai')
 
 
 class TestCrawl4AIScraperIntegration:
@@ -1,7 +1,7 @@
 """Tests for data models"""
 import pytest
 from datetime import datetime
-from src.models import JobListing, JobBoard
+from src.models import JobListing, JobBoard, EnrichedJob
 
 
 class TestJobListingIDGeneration:
@@ -173,6 +173,60 @@ class TestJobListingIDGeneration:
             "ID generation should be case-insensitive"
 
 
+class TestSlots:
+    """Test that model instances are slotted"""
+
+    def test_no_instance_dict(self):
+        """Slotted dataclasses should not allocate a per-instance __dict__"""
+        job = JobListing(
+            id=None,
+            title="Software Engineer",
+            company="Test Corp",
+            location="Taipei",
+            description="Test description",
+            url="https://example.com/job1",
+            posted_date=datetime.now(),
+            board_source=JobBoard.INDEED,
+        )
+
+        assert not hasattr(job, '__dict__')
+        assert job.id, "__post_init__ should still generate the ID"
+        with pytest.raises(AttributeError):
+            job.not_a_field = True
+
+
+class TestEnrichedJobFromListing:
+    """Test EnrichedJob construction from a JobListing"""
+
+    @staticmethod
+    def _job():
+        return JobListing(
+            id="job-1",
+            title="Software Engineer",
+            company="Test Corp",
+            location="Taipei",
+            description="Test description",
+            url="https://example.com/job1",
+            posted_date=datetime.now(),
+            board_source=JobBoard.INDEED,
+            scraped_at=datetime.now(),
+            raw_html="<div>" + "x" * 1000 + "</div>"
+        )
+
+    def test_drops_raw_html_by_default(self):
+        """Enriched copies should not retain the listing's raw HTML"""
+        enriched = EnrichedJob.from_job_listing(self._job(), taiwan_team_count=3)
+
+        assert enriched.raw_html is None
+        assert enriched.taiwan_team_count == 3
+
+    def test_keeps_raw_html_when_requested(self):
+        """include_raw_html should copy the HTML through"""
+        job = self._job()
+
+        assert EnrichedJob.from_job_listing(job, include_raw_html=True).raw_html == job.raw_html
+
+
 class TestJobBoardEnum:
     """Test JobBoard enum"""
 
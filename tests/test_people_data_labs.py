@@ -0,0 +1,439 @@
+"""Tests for the People Data Labs client"""
+import asyncio
+import json
+import time
+import httpx
+import pytest
+from src.enrichment import PeopleDataLabsEnricher
+from src.enrichment import people_data_labs as pdl_module
+
+
+def mock_client(handler):
+    """AsyncClient that answers every request with handler(request)"""
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+@pytest.fixture
+def enricher():
+    """PeopleDataLabsEnricher with a dummy API key"""
+    return PeopleDataLabsEnricher("test-key")
+
+
+class TestInflightDeduplication:
+    """Test sharing of concurrent duplicate requests"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_company_lookups_share_request(self, enricher):
+        """Equivalent concurrent lookups should hit the API once"""
+        requests = []
+
+        async def handler(request):
+            requests.append(request)
+            await asyncio.sleep(0.01)
+            return httpx.Response(200, json={'status': 200, 'data': {'name': "Acme"}})
+
+        enricher.client = mock_client(handler)
+
+        async with enricher:
+            first, second = await asyncio.gather(
+                enricher.get_company_profile("Acme"),
+                enricher.get_company_profile(" acme "),
+            )
+
+        assert len(requests) == 1
+        assert first is second
+        assert first.name == "Acme"
+
+    @pytest.mark.asyncio
+    async def test_sequential_lookups_are_not_cached(self, enricher):
+        """Completed requests should not be reused by later calls"""
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(404)
+
+        enricher.client = mock_client(handler)
+
+        async with enricher:
+            await enricher.get_company_profile("Acme")
+            await enricher.get_company_profile("Acme")
+
+        assert len(requests) == 2
+        assert enricher._inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_concurrent_employee_searches_share_request(self, enricher):
+        """Equivalent concurrent employee searches should hit the API once"""
+        requests = []
+
+        async def handler(request):
+            requests.append(request)
+            await asyncio.sleep(0.01)
+            return httpx.Response(200, json={'status': 200, 'data': [
+                {'full_name': "Alice", 'location_country': "taiwan"},
+            ]})
+
+        enricher.client = mock_client(handler)
+
+        async with enricher:
+            first, second = await asyncio.gather(
+                enricher.search_employees_in_asia("Acme"),
+                enricher.search_employees_in_asia("Acme"),
+            )
+
+        assert len(requests) == 1
+        assert first == second == [{
+            'name': "Alice",
+            'title': None,
+            'location': None,
+            'city': None,
+            'country': "Taiwan",
+            'linkedin_url': None,
+        }]
+
+
+class TestPersonSearchBody:
+    """Test cached person search request bodies"""
+
+    def test_matches_query_structure(self):
+        """Spliced bodies should decode to the full search query"""
+        body = pdl_module._person_search_body('term', 'Acme "Labs"', ['taiwan', 'china'], 50)
+
+        assert json.loads(body) == {
+            'query': {
+                'bool': {
+                    'must': [
+                        {'terms': {'location_country': ['taiwan', 'china']}},
+                        {'term': {'job_company_name': 'Acme "Labs"'}}
+                    ]
+                }
+            },
+            'size': 50,
+            'dataset': 'phone'
+        }
+
+    def test_terms_filter_takes_list(self):
+        """Batched searches should splice a list of company names"""
+        body = pdl_module._person_search_body('terms', ["Acme", "Globex"], ['taiwan'], 100)
+
+        assert json.loads(body)['query']['bool']['must'][1] == {'terms': {'job_company_name': ["Acme", "Globex"]}}
+
+    def test_excludes_fetched_ids(self):
+        """Follow-up searches should splice the ids to leave out"""
+        body = json.loads(pdl_module._person_search_body('terms', ["Acme"], ['taiwan'], 100, exclude_ids=["x1", "x2"]))
+
+        assert body['query']['bool']['must_not'] == [{'terms': {'id': ["x1", "x2"]}}]
+        assert 'must_not' not in json.loads(pdl_module._person_search_body('terms', ["Acme"], ['taiwan'], 100))['query']['bool']
+
+    def test_scroll_token(self):
+        """Continued searches should carry the previous page's scroll token"""
+        body = json.loads(pdl_module._person_search_body('terms', ["Acme"], ['taiwan'], 100, scroll_token='tok"1'))
+
+        assert body['scroll_token'] == 'tok"1'
+        assert 'scroll_token' not in json.loads(pdl_module._person_search_body('terms', ["Acme"], ['taiwan'], 100))
+
+
+class TestEmployeeBatch:
+    """Test batched employee searches across companies"""
+
+    @pytest.mark.asyncio
+    async def test_buckets_people_by_company(self, enricher):
+        """One request should cover the batch, with results grouped per company"""
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(200, json={'status': 200, 'total': 2, 'data': [
+                {'full_name': "Alice", 'job_company_name': "acme", 'location_country': "taiwan"},
+                {'full_name': "Bob", 'job_company_name': "globex", 'location_country': "singapore"},
+            ]})
+
+        enricher.client = mock_client(handler)
+
+        async with enricher:
+            teams = await enricher.search_employees_in_asia_batch(["Acme", "Globex", "Initech"])
+
+        assert len(requests) == 1
+        assert [member['name'] for member in teams["Acme"]] == ["Alice"]
+        assert [member['country'] for member in teams["Globex"]] == ["Singapore"]
+        assert teams["Initech"] == []
+
+    @pytest.mark.asyncio
+    async def test_capped_company_dropped_from_search(self, enricher, monkeypatch):
+        """Once a company reaches the cap the search should restart without it"""
+        monkeypatch.setattr(pdl_module, 'EMPLOYEE_SEARCH_MAX_SIZE', 3)
+        people = [
+            {'id': f"a{i}", 'full_name': f"Acme {i}", 'job_company_name': "acme"} for i in range(5)
+        ] + [
+            {'id': "g0", 'full_name': "Globex 0", 'job_company_name': "globex"},
+        ]
+        bodies = []
+
+        def handler(request):
+            body = json.loads(request.read())
+            bodies.append(body)
+            companies = body['query']['bool']['must'][1]['terms']['job_company_name']
+            excluded = set()
+            for clause in body['query']['bool'].get('must_not', []):
+                excluded.update(clause['terms']['id'])
+            matches = [person for person in people
+                       if person['job_company_name'] in {name.lower() for name in companies}
+                       and person['id'] not in excluded]
+            return httpx.Response(200, json={'status': 200, 'total': len(matches), 'data': matches[:body['size']]})
+
+        enricher.client = mock_client(handler)
+
+        async with enricher:
+            teams = await enricher.search_employees_in_asia_batch(["Acme", "Globex"])
+
+        assert [member['name'] for member in teams["Acme"]] == ["Acme 0", "Acme 1", "Acme 2"]
+        assert [member['name'] for member in teams["Globex"]] == ["Globex 0"]
+        assert len(bodies) == 2
+        assert bodies[1]['query']['bool']['must'][1]['terms']['job_company_name'] == ["Globex"]
+        assert 'must_not' not in bodies[1]['query']['bool']
+        assert 'scroll_token' not in bodies[1]
+
+    @pytest.mark.asyncio
+    async def test_truncated_batch_scrolls(self, enricher, monkeypatch):
+        """Pages past the first should be read with the scroll token, without re-sending fetched ids"""
+        monkeypatch.setattr(pdl_module, 'EMPLOYEE_SEARCH_MAX_SIZE', 3)
+        people = [
+            {'id': "a0", 'full_name': "Acme 0", 'job_company_name': "acme"},
+            {'id': "g0", 'full_name': "Globex 0", 'job_company_name': "globex"},
+            {'id': "a1", 'full_name': "Acme 1", 'job_company_name': "acme"},
+            {'id': "g1", 'full_name': "Globex 1", 'job_company_name': "globex"},
+        ]
+        bodies = []
+
+        def handler(request):
+            body = json.loads(request.read())
+            bodies.append(body)
+            start = int(body.get('scroll_token', 0))
+            page = people[start:start + body['size']]
+            return httpx.Response(200, json={'status': 200, 'total': len(people), 'data': page,
+                                             'scroll_token': str(start + len(page))})
+
+        enricher.client = mock_client(handler)
+
+        async with enricher:
+            teams = await enricher.search_employees_in_asia_batch(["Acme", "Globex"])
+
+        assert [member['name'] for member in teams["Acme"]] == ["Acme 0", "Acme 1"]
+        assert [member['name'] for member in teams["Globex"]] == ["Globex 0", "Globex 1"]
+        assert [body.get('scroll_token') for body in bodies] == [None, "3"]
+        assert all('must_not' not in body['query']['bool'] for body in bodies)
+
+    @pytest.mark.asyncio
+    async def test_restart_excludes_remaining_companies_records(self, enricher, monkeypatch):
+        """A restart should exclude only the fetched ids of companies still searched"""
+        monkeypatch.setattr(pdl_module, 'EMPLOYEE_SEARCH_MAX_SIZE', 2)
+        responses = iter([
+            httpx.Response(200, json={'status': 200, 'total': 9, 'scroll_token': "t", 'data': [
+                {'id': "a0", 'full_name': "Acme 0", 'job_company_name': "acme"},
+                {'id': "a1", 'full_name': "Acme 1", 'job_company_name': "acme"},
+                {'id': "g0", 'full_name': "Globex 0", 'job_company_name': "globex"},
+            ]}),
+            httpx.Response(200, json={'status': 200, 'total': 1, 'data': [
+                {'id': "g1", 'full_name': "Globex 1", 'job_company_name': "globex"},
+            ]}),
+        ])
+        bodies = []
+
+        def handler(request):
+            bodies.append(json.loads(request.read()))
+            return next(responses)
+
+        enricher.client = mock_client(handler)
+
+        async with enricher:
+            teams = await enricher.search_employees_in_asia_batch(["Acme", "Globex", "Initech"])
+
+        assert [member['name'] for member in teams["Globex"]] == ["Globex 0", "Globex 1"]
+        assert len(bodies) == 2
+        assert bodies[1]['query']['bool']['must'][1]['terms']['job_company_name'] == ["Globex", "Initech"]
+        assert bodies[1]['query']['bool']['must_not'] == [{'terms': {'id': ["g0"]}}]
+
+    @pytest.mark.asyncio
+    async def test_follow_up_error_keeps_fetched_records(self, enricher):
+        """Members already paid for should survive a failed follow-up page"""
+        responses = iter([
+            httpx.Response(200, json={'status': 200, 'total': 500, 'scroll_token': "t", 'data': [
+                {'id': "a0", 'full_name': "Alice", 'job_company_name': "acme"},
+            ]}),
+            httpx.Response(400, text="bad request"),
+        ])
+        enricher.client = mock_client(lambda request: next(responses))
+
+        async with enricher:
+            teams = await enricher.search_employees_in_asia_batch(["Acme", "Globex"])
+
+        assert [member['name'] for member in teams["Acme"]] == ["Alice"]
+        assert teams["Globex"] == []
+
+
+class TestRetry:
+    """Test retrying of transient API failures"""
+
+    @pytest.fixture(autouse=True)
+    def no_backoff(self, monkeypatch):
+        """Skip real backoff sleeps"""
+        monkeypatch.setattr(pdl_module, 'RETRY_BASE_DELAY', 0)
+
+    @pytest.mark.asyncio
+    async def test_retries_rate_limited_request(self, enricher):
+        """A 429 followed by success should return the successful result"""
+        responses = iter([
+            httpx.Response(429, headers={'Retry-After': '0'}),
+            httpx.Response(503),
+            httpx.Response(200, json={'status': 200, 'data': {'name': "Acme"}}),
+        ])
+        enricher.client = mock_client(lambda request: next(responses))
+
+        async with enricher:
+            profile = await enricher.get_company_profile("Acme")
+
+        assert profile.name == "Acme"
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_max_attempts(self, enricher):
+        """Persistent server errors should stop after MAX_ATTEMPTS"""
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(500)
+
+        enricher.client = mock_client(handler)
+
+        async with enricher:
+            employees = await enricher.search_employees_in_asia("Acme")
+
+        assert employees == []
+        assert len(requests) == pdl_module.MAX_ATTEMPTS
+
+    @pytest.mark.asyncio
+    async def test_company_lookup_error_raises(self, enricher):
+        """Exhausted retries should raise rather than look like a missing company"""
+        enricher.client = mock_client(lambda request: httpx.Response(500))
+
+        async with enricher:
+            with pytest.raises(httpx.HTTPStatusError):
+                await enricher.get_company_profile("Acme")
+
+    @pytest.mark.asyncio
+    async def test_does_not_retry_client_errors(self, enricher):
+        """Non-transient errors like 404 should not be retried"""
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(404)
+
+        enricher.client = mock_client(handler)
+
+        async with enricher:
+            assert await enricher.get_company_profile("Acme") is None
+
+        assert len(requests) == 1
+
+    @pytest.mark.asyncio
+    async def test_retries_network_errors(self, enricher):
+        """Transport errors should be retried like transient responses"""
+        attempts = []
+
+        def handler(request):
+            attempts.append(request)
+            if len(attempts) == 1:
+                raise httpx.ConnectError("connection reset", request=request)
+            return httpx.Response(200, json={'status': 200, 'data': {'name': "Acme"}})
+
+        enricher.client = mock_client(handler)
+
+        async with enricher:
+            profile = await enricher.get_company_profile("Acme")
+
+        assert profile.name == "Acme"
+        assert len(attempts) == 2
+
+
+class TestRetryAfter:
+    """Test Retry-After header parsing"""
+
+    def test_delta_seconds(self):
+        """Numeric values should be read as seconds"""
+        response = httpx.Response(429, headers={'Retry-After': '7'})
+
+        assert pdl_module._retry_after_seconds(response) == 7
+
+    def test_missing_or_invalid(self):
+        """Absent or unparseable headers should give None"""
+        assert pdl_module._retry_after_seconds(httpx.Response(429)) is None
+        assert pdl_module._retry_after_seconds(httpx.Response(429, headers={'Retry-After': 'soon'})) is None
+
+
+class TestRateLimit:
+    """Test request pacing"""
+
+    @pytest.mark.asyncio
+    async def test_requests_spaced_by_rps(self):
+        """Concurrent requests should be spread at least 1/rps seconds apart"""
+        sent_at = []
+
+        def handler(request):
+            sent_at.append(time.monotonic())
+            return httpx.Response(404)
+
+        enricher = PeopleDataLabsEnricher("test-key", rps=20)
+        enricher.client = mock_client(handler)
+
+        async with enricher:
+            await asyncio.gather(*(enricher.get_company_profile(f"Company {i}") for i in range(4)))
+
+        gaps = [later - earlier for earlier, later in zip(sent_at, sent_at[1:])]
+        assert len(gaps) == 3
+        assert min(gaps) >= 0.045
+
+    @pytest.mark.asyncio
+    async def test_disabled_without_rps(self):
+        """rps=None should send requests without pacing"""
+        enricher = PeopleDataLabsEnricher("test-key", rps=None)
+        enricher.client = mock_client(lambda request: httpx.Response(404))
+
+        started = time.monotonic()
+        async with enricher:
+            await asyncio.gather(*(enricher.get_company_profile(f"Company {i}") for i in range(10)))
+
+        assert time.monotonic() - started < 0.5
+
+
+class TestErrorBodyPreview:
+    """Test error response logging helper"""
+
+    def test_truncates_long_bodies(self):
+        """Only the first ERROR_BODY_PREVIEW_BYTES should be decoded"""
+        response = httpx.Response(500, content=b"x" * 10_000)
+
+        assert len(pdl_module._error_body_preview(response)) == pdl_module.ERROR_BODY_PREVIEW_BYTES
+
+    def test_tolerates_cut_multibyte_characters(self):
+        """A multi-byte character split at the cut should not raise"""
+        response = httpx.Response(500, content="é".encode() * pdl_module.ERROR_BODY_PREVIEW_BYTES)
+
+        assert pdl_module._error_body_preview(response).startswith("é")
+
+
+class TestFormatCompanySize:
+    """Test employee count bucketing"""
+
+    def test_bucket_boundaries(self, enricher):
+        """Counts on a threshold should fall in the lower bucket"""
+        assert enricher._format_company_size(1) == "1-10"
+        assert enricher._format_company_size(10) == "1-10"
+        assert enricher._format_company_size(11) == "11-50"
+        assert enricher._format_company_size(5000) == "1001-5000"
+        assert enricher._format_company_size(5001) == "5000+"
+
+    def test_missing_count(self, enricher):
+        """Unknown employee counts should give no size"""
+        assert enricher._format_company_size(None) is None
@@ -240,6 +240,20 @@ class TestRankJobs:
         # All jobs should have ranking_score assigned
         assert all(job.ranking_score > 0 for job in ranked), "All jobs should have scores"
 
+    def test_equal_scores_ordered_by_posted_date(self):
+        """Jobs with equal scores should be ordered newest first"""
+        ranker = JobRanker(RankingConfig(recency_weight=0))
+        now = datetime.now()
+
+        jobs = [
+            create_test_enriched_job(title="Older", taiwan_team_count=2, posted_date=now - timedelta(days=3)),
+            create_test_enriched_job(title="Newer", taiwan_team_count=2, posted_date=now),
+        ]
+
+        ranked = ranker.rank_jobs(jobs)
+
+        assert [job.title for job in ranked] == ["Newer", "Older"]
+
     def test_rank_empty_list(self):
         """Ranking empty list should return empty list"""
         ranker = JobRanker()
@@ -0,0 +1,368 @@
+"""Tests for database storage operations"""
+import pytest
+from datetime import datetime, timedelta
+from sqlalchemy import inspect, select
+from src.database import JobStorage, get_storage
+from src.database import storage as storage_module
+from src.database.models import Job
+from src.models import JobListing, JobBoard, CompanyProfile
+
+
+def create_test_job(
+    title="Software Engineer",
+    company="Test Corp",
+    location="Remote",
+    job_id=None
+):
+    """Helper to create test job listings"""
+    return JobListing(
+        id=job_id,
+        title=title,
+        company=company,
+        location=location,
+        description="Test job description",
+        url="https://indeed.com/viewjob?jk=abc123",
+        posted_date=datetime.now(),
+        board_source=JobBoard.INDEED,
+        scraped_at=datetime.now()
+    )
+
+
+@pytest.fixture
+def storage(tmp_path):
+    """JobStorage backed by a temporary SQLite file"""
+    return JobStorage(f"sqlite:///{tmp_path / 'jobs.db'}")
+
+
+class TestSaveJobs:
+    """Test batched job inserts"""
+
+    def test_saves_new_jobs(self, storage):
+        """All new jobs should be inserted"""
+        jobs = [create_test_job(title=f"Engineer {i}") for i in range(5)]
+
+        saved = storage.save_jobs(jobs)
+
+        assert saved == 5
+        assert len(storage.get_jobs(limit=100)) == 5
+
+    def test_skips_existing_jobs(self, storage):
+        """Jobs already in the database should not be inserted again"""
+        storage.save_jobs([create_test_job(title="Engineer 1")])
+
+        saved = storage.save_jobs([
+            create_test_job(title="Engineer 1"),
+            create_test_job(title="Engineer 2"),
+        ])
+
+        assert saved == 1, "Only the new job should be saved"
+        assert len(storage.get_jobs(limit=100)) == 2
+
+    def test_skips_duplicates_within_batch(self, storage):
+        """Duplicate IDs in the same batch should be saved once"""
+        jobs = [create_test_job(job_id="same-id"), create_test_job(job_id="same-id")]
+
+        saved = storage.save_jobs(jobs)
+
+        assert saved == 1
+
+    def test_large_batch_exceeding_variable_limit(self, storage):
+        """Batches larger than SQLite's parameter limit should still work"""
+        jobs = [create_test_job(title=f"Engineer {i}") for i in range(2000)]
+        storage.save_jobs(jobs[:1000])
+
+        saved = storage.save_jobs(jobs)
+
+        assert saved == 1000
+
+    def test_skips_existing_jobs_without_on_conflict(self, storage, monkeypatch):
+        """Dialects without ON CONFLICT support should fall back to a pre-check"""
+        monkeypatch.setattr(storage_module, 'ON_CONFLICT_INSERTS', {})
+        storage.save_jobs([create_test_job(title="Engineer 1")])
+
+        saved = storage.save_jobs([
+            create_test_job(title="Engineer 1"),
+            create_test_job(title="Engineer 2"),
+        ])
+
+        assert saved == 1
+        assert len(storage.get_jobs(limit=100)) == 2
+
+    def test_empty_batch(self, storage):
+        """An empty batch should save nothing"""
+        assert storage.save_jobs([]) == 0
+
+    def test_preserves_board_source(self, storage):
+        """Board source enum should round-trip through the database"""
+        storage.save_jobs([create_test_job()])
+
+        job = storage.get_jobs(limit=1)[0]
+
+        assert job.board_source.name == JobBoard.INDEED.name
+
+
+class TestUpdateJobEnrichment:
+    """Test single-job enrichment updates"""
+
+    def test_sets_column_fields_only(self, storage):
+        """Extra fields should update matching columns and ignore the rest"""
+        storage.save_jobs([create_test_job()])
+        job_id = storage.get_jobs(limit=1)[0].id
+
+        updated = storage.update_job_enrichment(
+            job_id=job_id,
+            company_id=None,
+            taiwan_team_count=3,
+            ranking_score=1.5,
+            industry="Software",
+            not_a_column="ignored"
+        )
+
+        job = storage.get_jobs(limit=1, enriched_only=True)[0]
+        assert updated
+        assert job.industry == "Software"
+        assert job.taiwan_team_count == 3
+
+
+class TestUpdateJobEnrichmentMany:
+    """Test batched enrichment updates"""
+
+    def test_updates_all_records(self, storage):
+        """Each record should update its job and stamp enriched_at"""
+        storage.save_jobs([create_test_job(title=f"Engineer {i}") for i in range(3)])
+        job_ids = [job.id for job in storage.get_jobs(limit=10)]
+
+        updated = storage.update_job_enrichment_many([
+            {'id': job_id, 'taiwan_team_count': 4, 'ranking_score': float(i)}
+            for i, job_id in enumerate(job_ids)
+        ])
+
+        assert updated == 3
+        jobs = storage.get_jobs(limit=10, enriched_only=True)
+        assert len(jobs) == 3
+        assert all(job.taiwan_team_count == 4 for job in jobs)
+
+    def test_skips_unknown_jobs(self, storage):
+        """Records for missing jobs should be ignored, not fail the batch"""
+        storage.save_jobs([create_test_job()])
+        job_id = storage.get_jobs(limit=1)[0].id
+
+        updated = storage.update_job_enrichment_many([
+            {'id': job_id, 'ranking_score': 1.0},
+            {'id': 'missing', 'ranking_score': 2.0},
+        ])
+
+        assert updated == 1
+
+    def test_empty_records(self, storage):
+        """An empty batch should be a no-op"""
+        assert storage.update_job_enrichment_many([]) == 0
+
+
+class TestCleanupOldJobs:
+    """Test bulk deletion of stale jobs"""
+
+    def test_deletes_only_old_jobs(self, storage):
+        """Jobs scraped before the cutoff should be removed"""
+        old_job = create_test_job(title="Old")
+        old_job.scraped_at = datetime.now() - timedelta(days=60)
+        storage.save_jobs([old_job, create_test_job(title="New")])
+
+        deleted = storage.cleanup_old_jobs(days=30)
+
+        assert deleted == 1
+        assert [job.title for job in storage.get_jobs(limit=10)] == ["New"]
+
+
+class TestSQLitePragmas:
+    """Test SQLite connection tuning"""
+
+    def test_wal_journal_mode(self, storage):
+        """File-backed databases should use WAL journaling"""
+        with storage.engine.connect() as conn:
+            mode = conn.exec_driver_sql("PRAGMA journal_mode").scalar()
+
+        assert mode == "wal"
+
+    def test_synchronous_normal(self, storage):
+        """synchronous should be NORMAL (1) rather than FULL (2)"""
+        with storage.engine.connect() as conn:
+            level = conn.exec_driver_sql("PRAGMA synchronous").scalar()
+
+        assert level == 1
+
+
+class TestSaveCompany:
+    """Test company and team member persistence"""
+
+    @staticmethod
+    def _company(member_count):
+        return CompanyProfile(
+            id="company-1",
+            name="Acme",
+            source="peopledatalabs",
+            enriched_at=datetime.now(),
+            taiwan_employees=[{'name': f"Employee {i}", 'city': 'Taipei'} for i in range(member_count)]
+        )
+
+    def test_saves_team_members(self, storage):
+        """All team members should be stored with the default country"""
+        assert storage.save_company(self._company(150))
+
+        company = storage.get_company_by_name("Acme")
+
+        assert len(company.team_members) == 150
+        assert company.team_members[0].country == "Taiwan"
+
+    def test_replaces_team_members(self, storage):
+        """Re-saving a company should replace, not append, its team members"""
+        storage.save_company(self._company(5))
+        storage.save_company(self._company(2))
+
+        company = storage.get_company_by_name("Acme")
+
+        assert len(company.team_members) == 2
+
+
+class TestGetCompaniesByNames:
+    """Test batched company cache lookups"""
+
+    def test_returns_recent_companies_by_name(self, storage):
+        """Known, recently enriched companies should be returned with team members"""
+        storage.save_company(CompanyProfile(
+            id="acme", name="Acme", source="peopledatalabs", enriched_at=datetime.now(),
+            taiwan_employees=[{'name': "Alice", 'city': "Taipei"}]
+        ))
+        storage.save_company(CompanyProfile(
+            id="stale", name="Stale", source="peopledatalabs",
+            enriched_at=datetime.now() - timedelta(days=60)
+        ))
+
+        companies = storage.get_companies_by_names(["Acme", "Stale", "Unknown"], max_age_days=30)
+
+        assert list(companies) == ["Acme"]
+        assert [member.name for member in companies["Acme"].team_members] == ["Alice"]
+
+    def test_empty_names(self, storage):
+        """No names should mean no query and no results"""
+        assert storage.get_companies_by_names([]) == {}
+
+
+class TestCompanyMisses:
+    """Test negative caching of unmatched company lookups"""
+
+    def test_returns_recent_misses(self, storage):
+        """Only recorded misses within max_age_days should be returned"""
+        storage.save_company_miss("Nowhere")
+
+        assert storage.get_company_misses(["Nowhere", "Acme"]) == {"Nowhere"}
+        assert storage.get_company_misses(["Nowhere"], max_age_days=0) == set()
+
+    def test_repeat_miss_refreshes_timestamp(self, storage):
+        """Recording a miss twice should update it rather than fail"""
+        assert storage.save_company_miss("Nowhere")
+        assert storage.save_company_miss("Nowhere")
+
+        assert storage.get_company_misses(["Nowhere"]) == {"Nowhere"}
+
+    def test_empty_names(self, storage):
+        """No names should mean no misses"""
+        assert storage.get_company_misses([]) == set()
+
+
+class TestGetJobsLite:
+    """Test column-only job retrieval"""
+
+    def test_returns_listing_columns(self, storage):
+        """Rows should expose the columns needed to rebuild a JobListing"""
+        storage.save_jobs([create_test_job(title="Engineer 1")])
+
+        row = storage.get_jobs_lite(limit=10)[0]
+
+        assert row.title == "Engineer 1"
+        assert row.company == "Test Corp"
+        assert row.board_source.name == JobBoard.INDEED.name
+        assert row.taiwan_team_count == 0
+
+    def test_can_skip_description(self, storage):
+        """Description should only be loaded when requested"""
+        storage.save_jobs([create_test_job()])
+
+        with_description = storage.get_jobs_lite(limit=1)[0]
+        without_description = storage.get_jobs_lite(limit=1, include_description=False)[0]
+
+        assert with_description.description == "Test job description"
+        assert 'description' not in without_description._fields
+
+    def test_matches_get_jobs(self, storage):
+        """Lite rows should follow the same filtering and ordering as get_jobs"""
+        storage.save_jobs([create_test_job(title=f"Engineer {i}") for i in range(5)])
+
+        full_ids = [job.id for job in storage.get_jobs(limit=3)]
+        lite_ids = [row.id for row in storage.get_jobs_lite(limit=3)]
+
+        assert lite_ids == full_ids
+
+
+class TestIndexes:
+    """Test that hot-path indexes are created"""
+
+    def test_job_indexes_created(self, storage):
+        """Job filter/cleanup indexes should exist"""
+        names = {index['name'] for index in inspect(storage.engine).get_indexes('jobs')}
+
+        assert {'ix_jobs_scraped_at', 'ix_jobs_taiwan_team_count', 'ix_jobs_enriched_at_partial'} <= names
+
+    def test_get_jobs_ordering_uses_index(self, storage):
+        """get_jobs ORDER BY should be served by an index, not a temp sort"""
+        query = storage._build_jobs_query(select(Job), limit=50, min_taiwan_team=0, enriched_only=False)
+        sql = str(query.compile(storage.engine, compile_kwargs={'literal_binds': True}))
+
+        with storage.engine.connect() as conn:
+            plan = " ".join(row[-1] for row in conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {sql}"))
+
+        assert 'ix_jobs_ranking_posted' in plan
+        assert 'TEMP B-TREE' not in plan
+
+    def test_indexes_added_to_existing_database(self, tmp_path):
+        """Indexes should be created on databases whose tables predate them"""
+        url = f"sqlite:///{tmp_path / 'legacy.db'}"
+        storage = JobStorage(url)
+        with storage.engine.begin() as conn:
+            conn.exec_driver_sql("DROP INDEX ix_jobs_scraped_at")
+
+        storage = JobStorage(url)
+
+        names = {index['name'] for index in inspect(storage.engine).get_indexes('jobs')}
+        assert 'ix_jobs_scraped_at' in names
+
+    def test_new_indexes_trigger_analyze(self, tmp_path):
+        """Planner statistics should be gathered when indexes are added late"""
+        url = f"sqlite:///{tmp_path / 'legacy.db'}"
+        storage = JobStorage(url)
+        storage.save_jobs([create_test_job()])
+        with storage.engine.begin() as conn:
+            conn.exec_driver_sql("DROP INDEX ix_jobs_ranking_posted")
+
+        storage = JobStorage(url)
+
+        with storage.engine.connect() as conn:
+            stats = conn.exec_driver_sql("SELECT idx FROM sqlite_stat1").scalars().all()
+        assert 'ix_jobs_ranking_posted' in stats
+
+
+class TestGetStorage:
+    """Test shared storage lookup"""
+
+    def test_same_url_returns_same_instance(self, tmp_path):
+        """Repeated lookups for one URL should share an engine"""
+        url = f"sqlite:///{tmp_path / 'shared.db'}"
+
+        assert get_storage(url) is get_storage(url)
+
+    def test_different_urls_return_different_instances(self, tmp_path):
+        """Each database URL should get its own storage"""
+        first = get_storage(f"sqlite:///{tmp_path / 'first.db'}")
+        second = get_storage(f"sqlite:///{tmp_path / 'second.db'}")
+
+        assert first is not second